@@ -17,33 +17,34 @@
 import sys
 import logging
 import argparse
+from typing import TYPE_CHECKING
 
-from PySide6.QtWidgets import QApplication
-from PySide6.QtGui import QIcon
-
-from midiwatch.gui import MainWindow
-from midiwatch.gui.loaders import initialize_resources
-from midiwatch.gui.app import get_lock_file_path, try_acquire_lock
 from midiwatch.core.logging_config import setup_logging
-from midiwatch.constants import APP_NAME
+from midiwatch.constants import APP_NAME, APP_VERSION
 
-from midiwatch.gui.resources import resources_rc
+if TYPE_CHECKING:
+    from PySide6.QtWidgets import QApplication
 
 
 if sys.platform == "win32":
     try:
         from ctypes import windll
 
-        myappid = "midiwatch.1.0.0"
+        myappid = f"{APP_NAME.lower()}.{APP_VERSION}"
         windll.shell32.SetCurrentProcessExplicitAppUserModelID(myappid)
     except ImportError:
         pass
 
 
-def main():
-    """Application main entry point."""
+def _parse_args() -> argparse.Namespace:
+    """Parse the command line arguments.
 
-    # Parse command line arguments
+    Only relies on argparse, so that --help and argument errors exit before Qt is
+    loaded.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
     parser = argparse.ArgumentParser(
         prog="midiwatch", description="MidiWatch - MIDI port monitor"
     )
@@ -52,7 +53,34 @@ def main():
         action="store_true",
         help="Enable development mode with automatic QSS reloading",
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--ignore-timing",
+        action="store_true",
+        help="Ignore MIDI timing events (clock and MTC quarter frames)",
+    )
+    return parser.parse_args()
+
+
+def _boot_qt() -> "QApplication":
+    """Import Qt and create the application instance.
+
+    Returns:
+        QApplication: The configured application instance.
+    """
+    from PySide6.QtWidgets import QApplication
+
+    app = QApplication(sys.argv)
+    app.setStyle("Fusion")
+    app.setApplicationName(APP_NAME)
+    app.setDesktopFileName("com.github.camhq.MidiWatch")
+    return app
+
+
+def main():
+    """Application main entry point."""
+
+    # Parse command line arguments
+    args = _parse_args()
 
     # Setup logging
     setup_logging()
@@ -60,11 +88,9 @@ def main():
     logger.info(f"{'=' * 20} Starting MidiWatch {'=' * 20}")
 
     # Create Qt application
-    app = QApplication(sys.argv)
-    app.setStyle("Fusion")
-    app.setApplicationName(APP_NAME)
-    app.setDesktopFileName("com.github.camhq.MidiWatch")
-    app.setWindowIcon(QIcon(":/images/midiwatch-icon.svg"))
+    app = _boot_qt()
+
+    from midiwatch.gui.app.single_instance import get_lock_file_path, try_acquire_lock
 
     # Attempt to acquire the lock
     lock_file_path = get_lock_file_path()
@@ -74,12 +100,22 @@ def main():
     if not lock_acquired:
         sys.exit(1)
 
-    # Launch the main window
-    window = MainWindow()
+    # Compiled resources are only registered once this instance is sure to run
+    from PySide6.QtGui import QIcon
+
+    from midiwatch.gui.resources import resources_rc
+    from midiwatch.gui.loaders import initialize_resources
+    from midiwatch.gui.main_window import MainWindow
 
-    # Initialize resources and apply stylesheet (after widgets creation)
+    app.setWindowIcon(QIcon(":/images/midiwatch-icon.svg"))
+
+    # Initialize resources and apply stylesheet (before widgets creation, so that
+    # widgets are polished only once with the application stylesheet)
     initialize_resources(app, dev_mode=args.dev)
 
+    # Launch the main window
+    window = MainWindow(ignore_timing=args.ignore_timing)
+
     # Run the event loop
     exit_code = app.exec()
 
@@ -1 +1 @@
-from .csv_exporter import CsvExporter
\ No newline at end of file
+from .csv_exporter import export_to_csv
\ No newline at end of file
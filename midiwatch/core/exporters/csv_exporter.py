@@ -14,97 +14,122 @@
 # You should have received a copy of the GNU General Public License
 # along with MidiWatch. If not, see <https://www.gnu.org/licenses/>.
 
+import io
+import re
 import csv
 from pathlib import Path
+from typing import Iterable, Iterator
 import logging
 
+from midiwatch.core.midi import MidiRow
+
 
 logger = logging.getLogger(__name__)
 
+# Header row of the exported CSV files.
+FIELDNAMES = ["Type", "Channel", "Note", "Detail", "Hex", "Binary"]
 
-class CsvExporter:
-    """Export MIDI messages to CSV format."""
+# Line terminator used by the csv module default dialect.
+_LINE_TERMINATOR = "\r\n"
 
-    FIELDNAMES = ["Type", "Channel", "Note", "Detail", "Hex", "Binary"]
+# Buffer size of the CSV output file, large enough to write typical captures in one
+# system call.
+_WRITE_BUFFER_SIZE = 1 << 20
 
-    def __init__(self, filepath: str) -> None:
-        """Initialize CSV exporter."""
-        self.filepath = Path(filepath)
-        logger.debug("CsvExporter initialized with filepath: %s", self.filepath)
+# Characters (other than the delimiter) that require a CSV field to be quoted.
+_QUOTE_OR_NEWLINE_RE = re.compile(r'["\r\n]')
 
-    def export_merged(
-        self, human_msgs: list[dict], hex_msgs: list[dict], binary_msgs: list[dict]
-    ) -> bool:
-        """Export merged messages from 3 sources to CSV.
 
-        Args:
-            human_msgs: List of human-readable message dictionaries
-            hex_msgs: List of hex message dictionaries
-            binary_msgs: List of binary message dictionaries
+def export_to_csv(filepath: str | Path, rows: Iterable[MidiRow]) -> bool:
+    """Export formatted MIDI messages to a CSV file.
 
-        Returns:
-            bool: True if export succeeded, False otherwise
-        """
-        logger.info(
-            "Starting export to %s with %d messages", self.filepath, len(human_msgs)
-        )
-        try:
-            merged = self._merge_messages(human_msgs, hex_msgs, binary_msgs)
-            logger.debug("Merged %d messages", len(merged))
-
-            self._write_csv(merged)
-            logger.info("Export successful : %s", self.filepath)
-            return True
-
-        except IOError as e:
-            logger.error("Failed to write CSV file: %s", self.filepath)
-            return False
-        except Exception as e:
-            logger.error("Unexpected error during export: %s", e)
-            return False
-
-    def _merge_messages(
-        self, human_msgs: list[dict], hex_msgs: list[dict], binary_msgs: list[dict]
-    ) -> list[dict]:
-        """Merge messages from 3 sources into unified dictionaries."""
-        logger.debug("Merging messages from 3 sources")
-
-        return [
-            {
-                "Type": h.get("type", ""),
-                "Channel": h.get("channel", ""),
-                "Note": h.get("note", ""),
-                "Detail": h.get("detail", ""),
-                "Hex": self._format_bytes(x),
-                "Binary": self._format_bytes(b),
-            }
-            for h, x, b in zip(human_msgs, hex_msgs, binary_msgs)
-        ]
-
-    def _format_bytes(self, msg: dict) -> str:
-        """Format message bytes to space-separated string."""
-        return " ".join(
-            filter(
-                None,
-                [
-                    msg.get("status_byte", ""),
-                    msg.get("data_byte_1", ""),
-                    msg.get("data_byte_2", ""),
-                ],
-            )
+    The rows are only iterated once, so they can be read in place from their storage.
+
+    Args:
+        filepath: Path of the CSV file to write
+        rows: Formatted messages
+
+    Returns:
+        bool: True if export succeeded, False otherwise
+    """
+    logger.info("Starting export to %s", filepath)
+    try:
+        _write_csv(filepath, _iter_rows(rows))
+        logger.info("Export successful : %s", filepath)
+        return True
+
+    except IOError as e:
+        logger.error("Failed to write CSV file: %s", filepath)
+        return False
+    except Exception as e:
+        logger.error("Unexpected error during export: %s", e)
+        return False
+
+
+def _iter_rows(rows: Iterable[MidiRow]) -> Iterator[tuple[str, ...]]:
+    """Yield one CSV row of strings per formatted message."""
+    for row in rows:
+        yield (
+            row.type,
+            "" if row.channel is None else str(row.channel),
+            "" if row.note is None else str(row.note),
+            row.detail,
+            _format_bytes(row.hex),
+            _format_bytes(row.binary),
         )
 
-    def _write_csv(self, messages: list[dict]) -> None:
-        """Write messages to CSV file."""
-        logger.debug("Writing %d messages to CSV", len(messages))
 
-        try:
-            with open(self.filepath, "w", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=self.FIELDNAMES)
-                writer.writeheader()
-                writer.writerows(messages)
-            logger.debug("CSV file written successfully: %s", self.filepath)
+def _format_bytes(msg_bytes: tuple[str, str, str]) -> str:
+    """Format message bytes to space-separated string."""
+    return " ".join(byte for byte in msg_bytes if byte)
+
+
+def _write_csv(filepath: str | Path, rows: Iterable[tuple[str, ...]]) -> None:
+    """Write rows to CSV file.
+
+    Formatted MIDI messages never contain characters that need CSV quoting, so rows
+    are joined into preformatted lines and written at once. If a row does need
+    quoting, it is written along with the remaining rows by the csv module.
+    """
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug("Writing messages to CSV")
+
+    separator_count = len(FIELDNAMES) - 1
+    rows = iter(rows)
+
+    try:
+        with open(filepath, "wb", buffering=_WRITE_BUFFER_SIZE) as raw:
+            with io.TextIOWrapper(
+                raw, encoding="utf-8", newline="", write_through=False
+            ) as f:
+                lines = [",".join(FIELDNAMES)]
+                special_row = None
+
+                for row in rows:
+                    line = ",".join(row)
+                    if (
+                        line.count(",") != separator_count
+                        or _QUOTE_OR_NEWLINE_RE.search(line) is not None
+                    ):
+                        special_row = row
+                        break
+                    lines.append(line)
+
+                lines.append("")
+                f.write(_LINE_TERMINATOR.join(lines))
+
+                if special_row is not None:
+                    if debug:
+                        logger.debug("Row requires quoting, using csv module")
+                    writer = csv.writer(f, lineterminator=_LINE_TERMINATOR)
+                    writer.writerow(special_row)
+                    writer.writerows(rows)
+
+        if debug:
+            logger.debug("CSV file written successfully: %s", filepath)
+
+    except IOError as e:
+        logger.error("IO error while writing CSV: %s", e)
+        raise
 
-        except IOError as e:
-            logger.error("IO error while writing CSV: %s", e)
-            raise
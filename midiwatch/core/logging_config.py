@@ -14,10 +14,25 @@
 # You should have received a copy of the GNU General Public License
 # along with MidiWatch. If not, see <https://www.gnu.org/licenses/>.
 
+import os
 import logging.config
 
 from midiwatch.core.paths import Paths
 
+DEFAULT_LOG_LEVEL = "INFO"
+
+# Level of the "midiwatch" loggers, can be overridden with the environment variable
+# MIDIWATCH_LOG_LEVEL (e.g. MIDIWATCH_LOG_LEVEL=DEBUG). Unknown level names fall back
+# to DEFAULT_LOG_LEVEL, with a warning once logging is set up.
+_REQUESTED_LOG_LEVEL = (
+    os.environ.get("MIDIWATCH_LOG_LEVEL") or DEFAULT_LOG_LEVEL
+).upper()
+LOG_LEVEL = (
+    _REQUESTED_LOG_LEVEL
+    if _REQUESTED_LOG_LEVEL in logging.getLevelNamesMapping()
+    else DEFAULT_LOG_LEVEL
+)
+
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
@@ -49,7 +64,7 @@ LOGGING = {
     "loggers": {
         "": {"level": "DEBUG", "handlers": ["file", "console"]},
         "midiwatch": {
-            "level": "DEBUG",
+            "level": LOG_LEVEL,
             "handlers": ["file", "console"],
             "propagate": False,
         },
@@ -60,3 +75,16 @@ LOGGING = {
 def setup_logging() -> None:
     """Initialize logging from config dict."""
     logging.config.dictConfig(LOGGING)
+
+    if LOG_LEVEL != _REQUESTED_LOG_LEVEL:
+        logging.getLogger(__name__).warning(
+            "Invalid MIDIWATCH_LOG_LEVEL '%s', using %s",
+            _REQUESTED_LOG_LEVEL,
+            LOG_LEVEL,
+        )
+
+    # Thread and process information is not part of the log format, skip collecting
+    # it for every record.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
@@ -1,2 +1,3 @@
 from .port_manager import MidiPortManager, MidiConnectionError
-from .message_formatter import MidiMessageFormatter
\ No newline at end of file
+from .message_formatter import MidiMessageFormatter, MidiRow
+from .message_decoder import decode_message_bytes
\ No newline at end of file
@@ -276,3 +276,11 @@ MIDI_NOTE_DETAILS = {
     126: {"name": "F♯", "octave": 9},
     127: {"name": "G", "octave": 9},
 }
+
+# Flat note name / octave lookups indexed by MIDI note number.
+NOTE_NAMES: tuple[str, ...] = tuple(
+    MIDI_NOTE_DETAILS[note]["name"] for note in range(MIDI_MAX_VALUE + 1)
+)
+NOTE_OCTAVES: tuple[int, ...] = tuple(
+    MIDI_NOTE_DETAILS[note]["octave"] for note in range(MIDI_MAX_VALUE + 1)
+)
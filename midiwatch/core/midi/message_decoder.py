@@ -0,0 +1,90 @@
+# This file is part of MidiWatch.
+# Copyright (C) 2025-2026 cam84
+#
+# MidiWatch is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# MidiWatch is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with MidiWatch. If not, see <https://www.gnu.org/licenses/>.
+
+from mido.messages import SPEC_BY_STATUS
+
+from .constants import PITCH_MAX
+
+
+_SYSEX_START = 0xF0
+_SYSEX_END = 0xF7
+_QUARTER_FRAME = 0xF1
+_SONG_POSITION = 0xF2
+_PITCH_WHEEL = 0xE0
+_DATA_BYTE_MAX = 0x7F
+
+# Offset between the unsigned 14-bit value of a Pitch Wheel message and its pitch.
+_PITCH_OFFSET = PITCH_MAX + 1
+
+
+def decode_message_bytes(msg_bytes: list[int]) -> dict:
+    """Decode raw MIDI bytes into message data, as returned by mido.
+
+    The result has the same keys as mido's Message.dict() (except "time"), plus the
+    "bytes" key holding the given bytes, so that it can be formatted directly without
+    building a mido Message.
+
+    Arguments:
+        msg_bytes: Raw bytes of a single MIDI message, status byte first.
+
+    Returns:
+        dict: Message data with a "bytes" key.
+
+    Raises:
+        ValueError: If the bytes are not a valid MIDI message.
+    """
+    if not msg_bytes:
+        raise ValueError("message is 0 bytes long")
+
+    status = msg_bytes[0]
+    spec = SPEC_BY_STATUS.get(status)
+    if spec is None:
+        raise ValueError(f"invalid status byte {status!r}")
+
+    msg_data = {"type": spec["type"], "bytes": msg_bytes}
+
+    if status == _SYSEX_START:
+        if msg_bytes[-1] != _SYSEX_END:
+            raise ValueError("sysex without end byte")
+        data = msg_bytes[1:-1]
+        if data and max(data) > _DATA_BYTE_MAX:
+            raise ValueError("data byte must be in range 0..127")
+        msg_data["data"] = data
+        return msg_data
+
+    length = spec["length"]
+    if len(msg_bytes) != length:
+        raise ValueError(f"invalid length for {spec['type']} message")
+
+    if length > 1 and max(msg_bytes[1:]) > _DATA_BYTE_MAX:
+        raise ValueError("data byte must be in range 0..127")
+
+    if status < _SYSEX_START:
+        msg_data["channel"] = status & 0x0F
+        if status & 0xF0 == _PITCH_WHEEL:
+            msg_data["pitch"] = (msg_bytes[1] | msg_bytes[2] << 7) - _PITCH_OFFSET
+        else:
+            # value_names starts with "channel", decoded from the status byte above
+            msg_data.update(zip(spec["value_names"][1:], msg_bytes[1:]))
+    elif status == _QUARTER_FRAME:
+        msg_data["frame_type"] = msg_bytes[1] >> 4
+        msg_data["frame_value"] = msg_bytes[1] & 0x0F
+    elif status == _SONG_POSITION:
+        msg_data["pos"] = msg_bytes[1] | msg_bytes[2] << 7
+    else:
+        msg_data.update(zip(spec["value_names"], msg_bytes[1:]))
+
+    return msg_data
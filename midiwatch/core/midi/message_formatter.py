@@ -14,7 +14,101 @@
 # You should have received a copy of the GNU General Public License
 # along with MidiWatch. If not, see <https://www.gnu.org/licenses/>.
 
-from .constants import MIDI_CC_NAMES, PITCH_MAX, MIDI_MAX_VALUE, MIDI_NOTE_DETAILS
+from functools import lru_cache
+
+from .constants import (
+    MIDI_CC_NAMES,
+    PITCH_MAX,
+    MIDI_MAX_VALUE,
+    NOTE_NAMES,
+    NOTE_OCTAVES,
+)
+from .message_decoder import decode_message_bytes
+
+
+# Display strings for every MIDI note number (e.g. "C4 (60)"), indexed by note number.
+_NOTE_DISPLAY: tuple[str, ...] = tuple(
+    f"{name}{octave} ({note})"
+    for note, (name, octave) in enumerate(zip(NOTE_NAMES, NOTE_OCTAVES))
+)
+
+# "<controller name>: " prefixes of Control Change details, indexed by CC number.
+_CC_DETAIL_PREFIX: tuple[str, ...] = tuple(
+    f"{MIDI_CC_NAMES.get(ctrl, f'CC {ctrl}')}: " for ctrl in range(MIDI_MAX_VALUE + 1)
+)
+
+# Scale factors converting raw values to percentages.
+_INV_MIDI_MAX = 100.0 / MIDI_MAX_VALUE
+_INV_PITCH_MAX = 100.0 / PITCH_MAX
+
+# Hexadecimal (e.g. "0xFF") and binary (e.g. "11111111") strings for every byte value.
+_HEX_TABLE: tuple[str, ...] = tuple(f"0x{byte:02X}" for byte in range(256))
+_BIN_TABLE: tuple[str, ...] = tuple(f"{byte:08b}" for byte in range(256))
+
+# Number of distinct short messages whose formatted rows are kept by each formatter.
+FORMAT_CACHE_SIZE = 512
+
+
+@lru_cache(maxsize=64)
+def _titleize(raw_type: str) -> str:
+    """Return the display name of a mido message type (e.g. "note_on" -> "Note On")."""
+    return raw_type.replace("_", " ").title()
+
+
+@lru_cache(maxsize=128)
+def _cc_header(ctrl: int) -> str:
+    """Return the display type of a Control Change message (e.g. "Control Change 7")."""
+    return f"Control Change {ctrl}"
+
+
+# Byte strings of a row whose raw bytes have not been formatted.
+_NO_BYTES = ("", "", "")
+
+
+class MidiRow:
+    """Formatted representation of a MIDI message, as displayed and exported.
+
+    A single row holds the human-readable, hexadecimal and binary forms of a message,
+    so that it can be shared by all the views. Identical messages may also share the
+    same row, which must therefore not be modified once formatted.
+
+    Attributes:
+        type: Human-readable message type name.
+        channel: 1-based channel number, None if not applicable.
+        note: Note name with octave (e.g., "C4 (60)") for note messages.
+        detail: Additional context (velocity %, CC name, position, etc.).
+        hex: Status byte and 2 data bytes as hex strings, missing bytes are empty.
+        binary: Status byte and 2 data bytes as binary strings, missing bytes are
+                empty.
+        human: Type, channel, note and detail, in the column order of the
+               human-readable view.
+    """
+
+    __slots__ = ("type", "channel", "note", "detail", "hex", "binary", "human")
+
+    def __init__(
+        self,
+        msg_type: str,
+        channel: int | None = None,
+        note: str | int | None = None,
+        detail: str = "",
+        hex: tuple[str, str, str] = _NO_BYTES,
+        binary: tuple[str, str, str] = _NO_BYTES,
+    ) -> None:
+        self.type = msg_type
+        self.channel = channel
+        self.note = note
+        self.detail = detail
+        self.hex = hex
+        self.binary = binary
+        self.human = (msg_type, channel, note, detail)
+
+    def __repr__(self) -> str:
+        return (
+            f"MidiRow(type={self.type!r}, channel={self.channel!r}, "
+            f"note={self.note!r}, detail={self.detail!r}, hex={self.hex!r}, "
+            f"binary={self.binary!r})"
+        )
 
 
 class MidiMessageFormatter:
@@ -36,7 +130,21 @@ class MidiMessageFormatter:
         "sysex": "_format_sysex_message",
     }
 
-    def format_message_human(self, msg_data: dict) -> dict:
+    def __init__(self) -> None:
+        """Bind the formatting methods registered in _FORMATTERS.
+
+        Also sets up the cache of rows formatted from short messages, as streams often
+        repeat identical messages (clock, sliders sending the same values...).
+        """
+        self._dispatch = {
+            raw_type: getattr(self, method_name)
+            for raw_type, method_name in self._FORMATTERS.items()
+        }
+        self._format_bytes_cached = lru_cache(maxsize=FORMAT_CACHE_SIZE)(
+            self._format_bytes
+        )
+
+    def format_message_human(self, msg_data: dict) -> MidiRow:
         """Format a MIDI message as human-readable strings.
 
         Transforms raw MIDI message data into a user-friendly format suitable for
@@ -46,170 +154,193 @@ class MidiMessageFormatter:
         Real-Time messages) receive automatic formatting: the type name is capitalized
         and no additional detail is provided.
 
-        Channel indexing is adjusted from 0-based to 1-based for display.
+        Channel indexing is adjusted from 0-based to 1-based for display. The given
+        message data is left untouched.
 
         Arguments:
             msg_data: Raw MIDI message data from mido.
 
         Returns:
-            dict: Formatted message with keys:
-                - "type": Human-readable message type name
-                - "channel": 1-based channel number (if applicable, empty otherwise)
-                - "note": Note name with octave (e.g., "C4 (60)") for note messages
-                - "detail": Additional context (velocity %, CC name, position, etc.)
+            MidiRow: Formatted message.
         """
         raw_type: str = msg_data.get("type", "unknown")
 
         # Adjust channel to 1-based indexing for display
-        if "channel" in msg_data:
-            msg_data["channel"] = msg_data["channel"] + 1
+        channel = msg_data.get("channel")
+        if channel is not None:
+            channel += 1
 
-        if raw_type in self._FORMATTERS:
-            method_name = self._FORMATTERS[raw_type]
-            getattr(self, method_name)(msg_data)
-        else:
-            msg_data["type"] = raw_type.replace("_", " ").title()
-            msg_data["detail"] = ""
+        handler = self._dispatch.get(raw_type)
+        if handler is not None:
+            return handler(msg_data, channel)
 
-        return msg_data
+        return MidiRow(_titleize(raw_type), channel, msg_data.get("note"))
 
-    def format_message_hex(self, msg_data: dict) -> dict:
-        """Format MIDI message bytes as hexadecimal strings.
+    def format_message_all(self, msg_data: dict) -> MidiRow:
+        """Format a MIDI message in human-readable, hexadecimal and binary forms.
 
-        Extracts up to 3 MIDI bytes (status byte and 2 data bytes) and formats them as
-        hexadecimal strings (e.g., "0xFF").
+        All forms are built in a single pass into one MidiRow, shared by all the views.
+        Messages of up to 3 bytes are entirely defined by their bytes: their rows are
+        cached by bytes and shared between identical messages.
 
         Arguments:
-            msg_data: Dictionary containing a "bytes" key with raw MIDI byte values.
+            msg_data: Raw MIDI message data from mido, with a "bytes" key.
 
         Returns:
-            dict: Mapping with keys "status_byte", "data_byte_1", "data_byte_2"
-                  containing hex string representations. Missing bytes are empty
-                  strings.
+            MidiRow: Formatted message, with its hex and binary byte strings.
         """
-        keys = ["status_byte", "data_byte_1", "data_byte_2"]
-        values = []
-        msg_bytes = msg_data.get("bytes", [])
-
-        for i in range(3):
-            try:
-                byte = msg_bytes[i]
-                values.append(f"0x{byte:02X}")
-            except IndexError:
-                # No byte available at this index
-                values.append("")
-
-        return dict(zip(keys, values))
+        msg_bytes = msg_data.get("bytes", ())
+        if 0 < len(msg_bytes) <= 3:
+            return self._format_bytes_cached(tuple(msg_bytes))
 
-    def format_message_binary(self, msg_data: dict) -> dict:
-        """Format MIDI message bytes as binary strings.
+        return self._format_message_all(msg_data)
 
-        Extracts up to 3 MIDI bytes (status byte and 2 data bytes) and formats them as
-        binary strings (e.g., "11111111").
+    def _format_bytes(self, msg_bytes: tuple[int, ...]) -> MidiRow:
+        """Format a MIDI message in all forms, from its raw bytes only.
 
         Arguments:
-            msg_data: Dictionary containing a "bytes" key with raw MIDI byte values.
-
-        Returns:
-            dict: Mapping with keys "status_byte", "data_byte_1", "data_byte_2"
-                  containing binary string representations (8 bits each). Missing bytes
-                  are empty strings.
+            msg_bytes: Raw bytes of the MIDI message.
         """
-        keys = ["status_byte", "data_byte_1", "data_byte_2"]
-        values = []
-        msg_bytes = msg_data.get("bytes", [])
+        return self._format_message_all(decode_message_bytes(msg_bytes))
 
-        for i in range(3):
-            try:
-                byte = msg_bytes[i]
-                values.append(f"{byte:08b}")
-            except IndexError:
-                # No byte available at this index
-                values.append("")
+    def _format_message_all(self, msg_data: dict) -> MidiRow:
+        """Format a MIDI message in all forms, without caching.
 
-        return dict(zip(keys, values))
-
-    def _format_note_message(self, msg_data: dict) -> None:
+        Arguments:
+            msg_data: Raw MIDI message data from mido, with a "bytes" key.
+        """
+        row = self.format_message_human(msg_data)
+
+        msg_bytes = msg_data.get("bytes", ())
+        count = len(msg_bytes)
+
+        if count > 2:
+            status, data_1, data_2 = msg_bytes[0], msg_bytes[1], msg_bytes[2]
+            row.hex = (_HEX_TABLE[status], _HEX_TABLE[data_1], _HEX_TABLE[data_2])
+            row.binary = (_BIN_TABLE[status], _BIN_TABLE[data_1], _BIN_TABLE[data_2])
+        elif count:
+            status = msg_bytes[0]
+            data_1 = msg_bytes[1] if count > 1 else None
+            row.hex = (
+                _HEX_TABLE[status],
+                "" if data_1 is None else _HEX_TABLE[data_1],
+                "",
+            )
+            row.binary = (
+                _BIN_TABLE[status],
+                "" if data_1 is None else _BIN_TABLE[data_1],
+                "",
+            )
+
+        return row
+
+    def _format_note_message(self, msg_data: dict, channel: int | None) -> MidiRow:
         """Format Note On/Off messages.
 
         Arguments:
-            msg_data: MIDI message dictionary to format in-place.
+            msg_data: Raw MIDI message data from mido.
+            channel: 1-based channel number.
         """
         midi_note = msg_data.get("note")
         raw_type: str = msg_data.get("type", "unknown")
 
-        if midi_note is not None and midi_note in MIDI_NOTE_DETAILS:
-            note_name = MIDI_NOTE_DETAILS[midi_note]["name"]
-            note_octave = MIDI_NOTE_DETAILS[midi_note]["octave"]
-            msg_data["note"] = f"{note_name}{note_octave} ({midi_note})"
+        if midi_note is not None and 0 <= midi_note <= MIDI_MAX_VALUE:
+            note = _NOTE_DISPLAY[midi_note]
+        else:
+            note = midi_note
 
         velocity = msg_data.get("velocity", 0)
-        percentage = (velocity / MIDI_MAX_VALUE) * 100
-        msg_data["type"] = raw_type.replace("_", " ").title()
-        msg_data["detail"] = f"Velocity: {percentage:.0f}% ({velocity})"
-
-    def _format_polytouch_message(self, msg_data: dict) -> None:
+        percentage = velocity * _INV_MIDI_MAX
+        return MidiRow(
+            _titleize(raw_type),
+            channel,
+            note,
+            f"Velocity: {percentage:.0f}% ({velocity})",
+        )
+
+    def _format_polytouch_message(self, msg_data: dict, channel: int | None) -> MidiRow:
         """Format Polyphonic Aftertouch messages.
 
         Arguments:
-            msg_data: MIDI message dictionary to format in-place.
+            msg_data: Raw MIDI message data from mido.
+            channel: 1-based channel number.
         """
         midi_note = msg_data.get("note")
         pressure = msg_data.get("value", 0)
-        percentage = (pressure / MIDI_MAX_VALUE) * 100
-        msg_data["type"] = "Polyphonic Touch"
-        msg_data["detail"] = f"{midi_note} → {percentage:.0f}% ({pressure})"
-
-    def _format_control_change_message(self, msg_data: dict) -> None:
+        percentage = pressure * _INV_MIDI_MAX
+        return MidiRow(
+            "Polyphonic Touch",
+            channel,
+            midi_note,
+            f"{midi_note} → {percentage:.0f}% ({pressure})",
+        )
+
+    def _format_control_change_message(
+        self, msg_data: dict, channel: int | None
+    ) -> MidiRow:
         """Format Control Change messages.
 
         Arguments:
-            msg_data: MIDI message dictionary to format in-place.
+            msg_data: Raw MIDI message data from mido.
+            channel: 1-based channel number.
         """
         ctrl = msg_data.get("control", None)
         value = msg_data.get("value", None)
-        if ctrl is not None:
-            name = MIDI_CC_NAMES.get(ctrl, f"CC {ctrl}")
-            msg_data["type"] = f"Control Change {ctrl}"
-            msg_data["detail"] = f"{name}: {value}"
+        if ctrl is None:
+            return MidiRow(_titleize(msg_data.get("type", "unknown")), channel)
 
-    def _format_program_change_message(self, msg_data: dict) -> None:
+        return MidiRow(
+            _cc_header(ctrl), channel, detail=_CC_DETAIL_PREFIX[ctrl] + str(value)
+        )
+
+    def _format_program_change_message(
+        self, msg_data: dict, channel: int | None
+    ) -> MidiRow:
         """Format Program Change messages.
 
         Arguments:
-            msg_data: MIDI message dictionary to format in-place.
+            msg_data: Raw MIDI message data from mido.
+            channel: 1-based channel number.
         """
         program = msg_data.get("program", 0)
-        msg_data["type"] = "Program Change"
-        msg_data["detail"] = f"Program: {program}"
+        return MidiRow("Program Change", channel, detail=f"Program: {program}")
 
-    def _format_aftertouch_message(self, msg_data: dict) -> None:
+    def _format_aftertouch_message(
+        self, msg_data: dict, channel: int | None
+    ) -> MidiRow:
         """Format Aftertouch messages.
 
         Arguments:
-            msg_data: MIDI message dictionary to format in-place.
+            msg_data: Raw MIDI message data from mido.
+            channel: 1-based channel number.
         """
         value = msg_data.get("value", 0)
-        percentage = (value / MIDI_MAX_VALUE) * 100
-        msg_data["type"] = "Aftertouch"
-        msg_data["detail"] = f"{percentage:.0f}% ({value})"
+        percentage = value * _INV_MIDI_MAX
+        return MidiRow("Aftertouch", channel, detail=f"{percentage:.0f}% ({value})")
 
-    def _format_pitchwheel_message(self, msg_data: dict) -> None:
+    def _format_pitchwheel_message(
+        self, msg_data: dict, channel: int | None
+    ) -> MidiRow:
         """Format Pitch Wheel messages.
 
         Arguments:
-            msg_data: MIDI message dictionary to format in-place.
+            msg_data: Raw MIDI message data from mido.
+            channel: 1-based channel number.
         """
         pitch = msg_data.get("pitch", 0)
-        percentage = (pitch / PITCH_MAX) * 100
-        msg_data["type"] = "Pitch Bend"
-        msg_data["detail"] = f"Pitch: {percentage:.0f}% ({pitch})"
-
-    def _format_quarter_frame_message(self, msg_data: dict) -> None:
+        percentage = pitch * _INV_PITCH_MAX
+        return MidiRow(
+            "Pitch Bend", channel, detail=f"Pitch: {percentage:.0f}% ({pitch})"
+        )
+
+    def _format_quarter_frame_message(
+        self, msg_data: dict, channel: int | None
+    ) -> MidiRow:
         """Format MTC Quarter Frame messages.
 
         Arguments:
-            msg_data: MIDI message dictionary to format in-place.
+            msg_data: Raw MIDI message data from mido.
+            channel: 1-based channel number (not applicable, None).
         """
         frame_type = msg_data.get("frame_type", 0)
         frame_value = msg_data.get("frame_value", 0)
@@ -228,36 +359,39 @@ class MidiMessageFormatter:
 
         type_name = type_names.get(frame_type, f"Type {frame_type}")
 
-        msg_data["type"] = "MTC Quarter Frame"
-        msg_data["detail"] = f"{type_name}: {frame_value}"
+        return MidiRow(
+            "MTC Quarter Frame", channel, detail=f"{type_name}: {frame_value}"
+        )
 
-    def _format_songpos_message(self, msg_data: dict) -> None:
+    def _format_songpos_message(self, msg_data: dict, channel: int | None) -> MidiRow:
         """Format Song Position messages.
 
         Arguments:
-            msg_data: MIDI message dictionary to format in-place.
+            msg_data: Raw MIDI message data from mido.
+            channel: 1-based channel number (not applicable, None).
         """
         pos = msg_data.get("pos", 0)
-        msg_data["type"] = "Song Position"
-        msg_data["detail"] = f"Position: {pos}"
+        return MidiRow("Song Position", channel, detail=f"Position: {pos}")
 
-    def _format_song_select_message(self, msg_data: dict) -> None:
+    def _format_song_select_message(
+        self, msg_data: dict, channel: int | None
+    ) -> MidiRow:
         """Format Song Select messages.
 
         Arguments:
-            msg_data: MIDI message dictionary to format in-place.
+            msg_data: Raw MIDI message data from mido.
+            channel: 1-based channel number (not applicable, None).
         """
         song = msg_data.get("song", 0)
-        msg_data["type"] = "Song Select"
-        msg_data["detail"] = f"Song: {song}"
+        return MidiRow("Song Select", channel, detail=f"Song: {song}")
 
-    def _format_sysex_message(self, msg_data: dict) -> None:
+    def _format_sysex_message(self, msg_data: dict, channel: int | None) -> MidiRow:
         """Format System Exclusive messages.
 
         Arguments:
-            msg_data: MIDI message dictionary to format in-place.
+            msg_data: Raw MIDI message data from mido.
+            channel: 1-based channel number (not applicable, None).
         """
         data = msg_data.get("data", ())
         byte_count = len(data)
-        msg_data["type"] = "System Exclusive"
-        msg_data["detail"] = f"Data: {byte_count} bytes"
+        return MidiRow("System Exclusive", channel, detail=f"Data: {byte_count} bytes")
@@ -15,8 +15,10 @@
 # along with MidiWatch. If not, see <https://www.gnu.org/licenses/>.
 
 import re
+import time
 import platform
-from typing import Callable
+from functools import cache, wraps
+from typing import Callable, TypeVar
 import logging
 
 import mido
@@ -27,23 +29,111 @@ logger = logging.getLogger(__name__)
 
 # Type aliases
 PortList = list[str]
+F = TypeVar("F", bound=Callable)
+
+# Client and port numbers appended to ALSA port names (e.g. " 20:0").
+_ALSA_PORT_SUFFIX_RE = re.compile(r" \d+:\d+$")
+
+_IS_LINUX = platform.system() == "Linux"
+
+# Duration (in seconds) during which fetched port names are reused.
+PORT_NAMES_CACHE_TTL = 1.0
 
 
 class MidiConnectionError(Exception):
     """Custom exception for MIDI connection errors."""
 
 
+@cache
+def _rtmidi_probes() -> tuple | None:
+    """Return the long-lived RtMidi clients used to enumerate MIDI ports.
+
+    mido creates and destroys an RtMidi client (an ALSA sequencer client on Linux) each
+    time the port names are requested. Enumerating through clients that are kept for
+    the lifetime of the application avoids that round-trip.
+
+    Returns:
+        tuple | None: The RtMidi input and output clients, or None if mido is not
+        configured to use the RtMidi backend with its default API.
+    """
+    backend = mido.backend
+    if backend.name != "mido.backends.rtmidi" or backend.api is not None:
+        return None
+
+    import rtmidi
+
+    return rtmidi.MidiIn(), rtmidi.MidiOut()
+
+
+def _get_input_names() -> PortList:
+    """Return the names of the available MIDI input ports, as mido would."""
+    probes = _rtmidi_probes()
+    if probes is None:
+        return mido.get_input_names()
+    return list(dict.fromkeys(probes[0].get_ports()))
+
+
+def _get_output_names() -> PortList:
+    """Return the names of the available MIDI output ports, as mido would."""
+    probes = _rtmidi_probes()
+    if probes is None:
+        return mido.get_output_names()
+    return list(dict.fromkeys(probes[1].get_ports()))
+
+
 class PortNamesDescriptor:
-    """Fetch and filter MIDI port names dynamically."""
+    """Fetch and filter MIDI port names dynamically.
+
+    Enumerating the MIDI ports queries the system, so the filtered names are reused
+    for PORT_NAMES_CACHE_TTL seconds, or until invalidate() is called.
+    """
 
-    def __init__(self, get_ports_names_func: Callable[[], PortList]) -> None:
+    __slots__ = (
+        "get_port_names_func",
+        "excluded_re",
+        "_excluded_gate",
+        "_cached_names",
+        "_cached_at",
+    )
+
+    def __init__(
+        self,
+        get_ports_names_func: Callable[[], PortList],
+        excluded_re: re.Pattern[str] | None = None,
+    ) -> None:
         """Initialize the descriptor with a function to fetch port names.
 
         Arguments:
             get_ports_names_func: A function that retrieves the list of MIDI port
             names.
+            excluded_re: Compiled pattern matching the port names to exclude. If None,
+            it is built from the EXCLUDED_KEYWORDS of the owner class, if any.
         """
         self.get_port_names_func = get_ports_names_func
+        self.excluded_re = excluded_re
+        self._excluded_gate: str | None = None
+        self._cached_names: PortList | None = None
+        self._cached_at = 0.0
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        """Build the exclusion pattern from the owner class, once at class creation.
+
+        Arguments:
+            owner: The owner class of the descriptor.
+            name: The attribute name of the descriptor in the owner class.
+        """
+        if self.excluded_re is None:
+            excluded_keywords = getattr(owner, "EXCLUDED_KEYWORDS", ())
+            if excluded_keywords:
+                self.excluded_re = re.compile(
+                    "|".join(map(re.escape, excluded_keywords))
+                )
+
+                # When all keywords start with the same character, names without
+                # that character can be kept without running the pattern
+                first_chars = {keyword[0] for keyword in excluded_keywords if keyword}
+                if len(first_chars) == 1:
+                    self._excluded_gate = first_chars.pop()
 
     def __get__(self, obj: object, owner: type) -> PortList:
         """Fetch and process the list of MIDI port names when the attribute is
@@ -56,59 +146,142 @@ class PortNamesDescriptor:
         Returns:
             list: A filtered and processed list of MIDI port names.
         """
-        port_names = self.get_port_names_func()
-        excluded_keywords = (
-            owner.EXCLUDED_KEYWORDS if hasattr(owner, "EXCLUDED_KEYWORDS") else []
-        )
-        return self._filter_port_names(port_names, excluded_keywords)
+        now = time.monotonic()
+
+        if self._cached_names is None or now - self._cached_at >= PORT_NAMES_CACHE_TTL:
+            self._cached_names = self._filter_port_names(self.get_port_names_func())
+            self._cached_at = now
 
-    def _filter_port_names(
-        self, port_names: PortList, excluded_keywords: list[str]
-    ) -> PortList:
-        """Filter port names based on excluded keywords and process them.
+        return self._cached_names.copy()
+
+    def invalidate(self) -> None:
+        """Discard the cached port names, so that they are fetched on next access."""
+        self._cached_names = None
+
+    def _filter_port_names(self, port_names: PortList) -> PortList:
+        """Filter port names matching the excluded pattern and process them.
 
         Arguments:
             port_names: List of raw MIDI port names.
-            excluded_keywords: List of keywords to exclude from the port names. Ports
-            containing any of these keywords will be ignored.
 
         Returns:
             list: A filtered and processed list of port names.
         """
+        process_port_name = self._process_port_names
+
+        if self.excluded_re is None:
+            return [process_port_name(port_name) for port_name in port_names]
+
+        is_excluded = self.excluded_re.search
+        gate = self._excluded_gate
+
+        if gate is not None:
+            return [
+                process_port_name(port_name)
+                for port_name in port_names
+                if gate not in port_name or is_excluded(port_name) is None
+            ]
+
         return [
-            self._process_port_names(port_name)
+            process_port_name(port_name)
             for port_name in port_names
-            if not any(keyword in port_name for keyword in excluded_keywords)
+            if is_excluded(port_name) is None
         ]
 
-    @staticmethod
-    def _process_port_names(port_name: str) -> str:
-        """Process ALSA port names under Linux to remove port numbers, which can change
-        between sessions.
+    # The platform check is done once, when the class is defined, so that the
+    # processing function is called directly for each port name.
+    if _IS_LINUX:
 
-        Arguments:
-            port_name: The raw MIDI port name.
+        @staticmethod
+        def _process_port_names(port_name: str) -> str:
+            """Process ALSA port names under Linux to remove port numbers, which can
+            change between sessions.
 
-        Returns:
-            str: The processed port name.
-        """
-        if platform.system() == "Linux":
-            return re.sub(r" \d+:\d+$", "", port_name)
-        return port_name
+            Arguments:
+                port_name: The raw MIDI port name.
+
+            Returns:
+                str: The processed port name.
+            """
+            return _ALSA_PORT_SUFFIX_RE.sub("", port_name)
+
+    else:
+
+        @staticmethod
+        def _process_port_names(port_name: str) -> str:
+            """Return port names unchanged on platforms other than Linux.
+
+            Arguments:
+                port_name: The raw MIDI port name.
 
+            Returns:
+                str: The port name.
+            """
+            return port_name
 
-class UnsetPort:
-    """Special class to represent an uninitialized MIDI port."""
 
-    def __repr__(self):
-        return "<UnsetPort>"
+def _wrap_midi_errors(operation: str, level: int = logging.WARNING) -> Callable[[F], F]:
+    """Turn the errors raised by a MIDI port operation into MidiConnectionError.
+
+    When the decorated method is given a port name, it is quoted in the log and error
+    messages.
+
+    Arguments:
+        operation: Description of the operation, used in log and error messages
+        (e.g. "open MIDI input port").
+        level: Logging level of the error messages.
+
+    Returns:
+        Callable: A decorator applying the error handling to the decorated method.
+    """
+
+    def decorator(func: F) -> F:
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return func(self, *args, **kwargs)
+            except MidiConnectionError:
+                raise
+            except Exception as error:
+                description = f"{operation} '{args[0]}'" if args else operation
+                if isinstance(error, OSError):
+                    logger.log(level, "Failed to %s: %s", description, error)
+                    raise MidiConnectionError(
+                        f"Failed to {description}: {error}"
+                    ) from error
+
+                logger.log(
+                    level, "Unexpected error while trying to %s: %s", description, error
+                )
+                raise MidiConnectionError(
+                    f"Unexpected error while trying to {description}: {error}"
+                ) from error
+
+        return wrapper  # type: ignore
+
+    return decorator
+
+
+def _close_replaced_port(port: BaseInput | BaseOutput) -> None:
+    """Close a MIDI port that has been replaced by a newly opened one.
+
+    The new port is already in use, so a failure is only logged.
+
+    Arguments:
+        port: The previously opened MIDI port.
+    """
+    try:
+        port.close()
+        logger.info("MIDI port '%s' closed successfully", port.name)
+    except Exception as error:
+        logger.warning("Failed to close replaced MIDI port '%s': %s", port.name, error)
 
 
 class MidiPortManager:
     """Handle MIDI input and output ports.
 
-    Retrieve the names of available ports dynamically using the mido.get_input_names and
-    mido.get_output_names methods.
+    Retrieve the names of available ports dynamically, through long-lived RtMidi clients
+    or the mido.get_input_names and mido.get_output_names methods.
 
     Attributes:
         EXCLUDED_KEYWORDS: List of keywords to exclude from the port names.
@@ -116,103 +289,112 @@ class MidiPortManager:
         output_names: Descriptor to fetch and filter MIDI output port names.
     """
 
+    __slots__ = ("_inport", "_outport")
+
     EXCLUDED_KEYWORDS = ["RtMidiOut Client", "RtMidiIn Client"]
-    input_names = PortNamesDescriptor(mido.get_input_names)  # type: ignore
-    output_names = PortNamesDescriptor(mido.get_output_names)  # type: ignore
+    input_names = PortNamesDescriptor(_get_input_names)  # type: ignore
+    output_names = PortNamesDescriptor(_get_output_names)  # type: ignore
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Discard the cached input and output port names."""
+        for attribute in vars(cls).values():
+            if isinstance(attribute, PortNamesDescriptor):
+                attribute.invalidate()
 
     def __init__(self):
         """Initialize the MidiPortManager instance."""
-        self._inport: BaseInput | UnsetPort = UnsetPort()
-        self._outport: BaseOutput | UnsetPort = UnsetPort()
+        self._inport: BaseInput | None = None
+        self._outport: BaseOutput | None = None
         logger.debug("MidiPortManager initialized")
 
+    @_wrap_midi_errors("open MIDI input port")
     def open_input(self, port_name: str) -> None:
         """Open a MIDI input port if the given port name is available.
 
         Arguments:
             port_name: The name of the MIDI input port to open.
+
+        Raises:
+            MidiConnectionError: If the input port can't be opened.
         """
         logger.debug("Attempting to open MIDI input port: '%s'", port_name)
+        previous_port = self._inport
 
+        # Open the new port before closing the previous one, to shorten the time
+        # without an open port when switching devices
         try:
-            # Close the previous port if it exists
-            if not isinstance(self._inport, UnsetPort):
-                self.close_input()
-
-            # Open the new port
             self._inport = mido.open_input(port_name)  # type: ignore
-            logger.info("MIDI input port '%s' opened successfully", port_name)
-
-        except OSError as error:
-            logger.warning("Failed to open MIDI input port '%s': %s", port_name, error)
-            raise MidiConnectionError(f"Failed to open MIDI input port: {error}")
-        except Exception as error:
-            logger.warning(
-                "Unexpected error while opening MIDI input port: '%s'", error
-            )
-            raise MidiConnectionError(f"Unexpected error: {error}")
+        except OSError:
+            if previous_port is None:
+                raise
+
+            # Some backends can't open a device twice: release the previous port and
+            # retry
+            self.close_input()
+            previous_port = None
+            self._inport = mido.open_input(port_name)  # type: ignore
+
+        logger.info("MIDI input port '%s' opened successfully", port_name)
+
+        if previous_port is not None:
+            _close_replaced_port(previous_port)
 
+    @_wrap_midi_errors("open MIDI output port")
     def open_output(self, port_name: str) -> None:
         """Open a MIDI output port if the given port name is available.
 
         Arguments:
             port_name: The name of the MIDI output port to open.
+
+        Raises:
+            MidiConnectionError: If the output port can't be opened.
         """
         logger.debug("Attempting to open MIDI output port: '%s'", port_name)
+        previous_port = self._outport
 
+        # Open the new port before closing the previous one, to shorten the time
+        # without an open port when switching devices
         try:
-            # Close the previous port if it exists
-            if not isinstance(self._outport, UnsetPort):
-                self.close_output()
-
-            # Open the new port
             self._outport = mido.open_output(port_name, autoreset=True)  # type: ignore
-            logger.info("MIDI output port '%s' opened successfully", port_name)
-
-        except OSError as error:
-            logger.warning("Failed to open MIDI output port: '%s'", error)
-            raise MidiConnectionError(f"Failed to open MIDI output port: {error}")
-        except Exception as error:
-            logger.warning(
-                "Unexpected error while opening MIDI output port: '%s'", error
-            )
-            raise MidiConnectionError(f"Unexpected error: {error}")
+        except OSError:
+            if previous_port is None:
+                raise
+
+            # Some backends can't open a device twice: release the previous port and
+            # retry
+            self.close_output()
+            previous_port = None
+            self._outport = mido.open_output(port_name, autoreset=True)  # type: ignore
+
+        logger.info("MIDI output port '%s' opened successfully", port_name)
+
+        if previous_port is not None:
+            _close_replaced_port(previous_port)
 
+    @_wrap_midi_errors("close MIDI input port", level=logging.ERROR)
     def close_input(self) -> None:
         """Close the currently opened MIDI input port, if any.
 
         Raises:
             MidiConnectionError: If an error occurs while closing the input port.
         """
-        if not isinstance(self._inport, UnsetPort):
-            try:
-                self._inport.close()
-                logger.info(
-                    "MIDI input port '%s' closed successfully", self._inport.name
-                )
-                self._inport = UnsetPort()
-
-            except Exception as error:
-                logger.error("Failed to close MIDI input port: '%s'", error)
-                raise MidiConnectionError(f"Failed to close MIDI input port: {error}")
+        if self._inport is not None:
+            self._inport.close()
+            logger.info("MIDI input port '%s' closed successfully", self._inport.name)
+            self._inport = None
 
+    @_wrap_midi_errors("close MIDI output port", level=logging.ERROR)
     def close_output(self) -> None:
         """Close the currently opened MIDI output port, if any.
 
         Raises:
             MidiConnectionError: If an error occurs while closing the output port.
         """
-        if not isinstance(self._outport, UnsetPort):
-            try:
-                self._outport.close()
-                logger.info(
-                    "MIDI output port '%s' closed successfully", self._outport.name
-                )
-                self._outport = UnsetPort()
-
-            except Exception as error:
-                logger.error("Failed to close MIDI output port: '%s'.", error)
-                raise MidiConnectionError(f"Failed to close MIDI output port: {error}")
+        if self._outport is not None:
+            self._outport.close()
+            logger.info("MIDI output port '%s' closed successfully", self._outport.name)
+            self._outport = None
 
     @property
     def input_port(self) -> BaseInput:
@@ -224,12 +406,31 @@ class MidiPortManager:
         Raises:
             MidiConnectionError: If the input port hasn't been set yet.
         """
-        if isinstance(self._inport, UnsetPort):
+        if self._inport is None:
             raise MidiConnectionError(
                 "Input port is not configured. Call open_input() first"
             )
         return self._inport
 
+    @property
+    def rtmidi_input(self):
+        """Get the python-rtmidi input underlying the input port, if any.
+
+        Returns:
+            rtmidi.MidiIn | None: The rtmidi input of the active port, None if the
+                input port is not configured or mido does not use the rtmidi backend.
+        """
+        if self._inport is None or mido.backend.name != "mido.backends.rtmidi":
+            return None
+
+        # Deliberately relies on a mido internal: the rtmidi backend keeps its
+        # rtmidi.MidiIn in the private _rt attribute of the port. The type is checked
+        # so that a change of that internal falls back to the mido callback.
+        import rtmidi
+
+        rtmidi_input = getattr(self._inport, "_rt", None)
+        return rtmidi_input if isinstance(rtmidi_input, rtmidi.MidiIn) else None
+
     @property
     def output_port(self) -> BaseOutput:
         """Get the output port, ensuring it's properly set.
@@ -240,7 +441,7 @@ class MidiPortManager:
         Raises:
             MidiConnectionError: If the output port hasn't been set yet.
         """
-        if isinstance(self._outport, UnsetPort):
+        if self._outport is None:
             raise MidiConnectionError(
                 "Output port is not configured. Call open_output() first"
             )
@@ -22,7 +22,12 @@ from pathlib import Path
 class Paths:
     """Manage project directory structure and provide dynamic paths."""
 
-    base: Path = Path(__file__).resolve().parent.parent.parent
+    # Located without Path.resolve(), which stats every ancestor directory: module
+    # paths are already absolute, and a frozen build lives next to its executable
+    if getattr(sys, "frozen", False):
+        base: Path = Path(sys.executable).parent
+    else:
+        base: Path = Path(__file__).parent.parent.parent
     midiwatch_dir: Path = base / "midiwatch"
     resources_dir: Path = midiwatch_dir / "gui" / "resources"
     fonts: Path = resources_dir / "fonts"
@@ -82,3 +87,17 @@ class Paths:
             log_dir = cls.logs
         log_dir.mkdir(parents=True, exist_ok=True)
         return str(log_dir / filename)
+
+    @classmethod
+    def cache(cls, filename: str) -> str:
+        """Return the path of a file in the user cache directory.
+
+        Arguments:
+            filename: Name of the cache file.
+
+        Returns:
+            str: Absolute path to the cache file.
+        """
+        cache_dir = platformdirs.user_cache_path(appname="midiwatch")
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        return str(cache_dir / filename)
@@ -1,2 +1,21 @@
-from .main_window import MainWindow
-from .loaders.loader import initialize_resources
\ No newline at end of file
+# MainWindow and initialize_resources pull in every widget, model and thread,
+# so they are only imported on first access (the single-instance check in
+# midiwatch.gui.app must stay cheap).
+_LAZY_EXPORTS = {
+    "MainWindow": ".main_window",
+    "initialize_resources": ".loaders.loader",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+__all__ = list(_LAZY_EXPORTS)
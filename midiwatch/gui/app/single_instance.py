@@ -14,8 +14,8 @@
 # You should have received a copy of the GNU General Public License
 # along with MidiWatch. If not, see <https://www.gnu.org/licenses/>.
 
-import os
 import logging
+from functools import cache
 
 from PySide6.QtCore import QStandardPaths, QLockFile
 
@@ -23,6 +23,20 @@ from PySide6.QtCore import QStandardPaths, QLockFile
 logger = logging.getLogger(__name__)
 
 
+@cache
+def _temp_dir() -> str:
+    """
+    Return the system's temporary directory.
+
+    The location does not change during the lifetime of the process, so it is only
+    queried once, on first use.
+
+    Returns:
+        str: Path of the temporary directory, with "/" separators
+    """
+    return QStandardPaths.writableLocation(QStandardPaths.StandardLocation.TempLocation)
+
+
 def get_lock_file_path() -> str:
     """
     Return the full path of the lock file.
@@ -32,11 +46,8 @@ def get_lock_file_path() -> str:
     Returns:
         str: Full path to the lock file
     """
-    temp_dir = QStandardPaths.writableLocation(
-        QStandardPaths.StandardLocation.TempLocation
-    )
-
-    return os.path.join(temp_dir, "midiwatch.lock")
+    # Qt always returns paths with "/" separators, on every platform
+    return f"{_temp_dir()}/midiwatch.lock"
 
 
 def try_acquire_lock(lock_file_path: str) -> tuple[QLockFile, bool]:
@@ -44,7 +55,7 @@ def try_acquire_lock(lock_file_path: str) -> tuple[QLockFile, bool]:
     Attempt to acquire a lock for the application.
 
     Creates a lock that prevents multiple instances of the application from running
-    simultaneously.
+    simultaneously. The attempt is non-blocking.
 
     Args:
         lock_file_path: Path to the lock file
@@ -55,9 +66,14 @@ def try_acquire_lock(lock_file_path: str) -> tuple[QLockFile, bool]:
             - bool: True if lock acquired, False otherwise
     """
     lock_file = QLockFile(lock_file_path)
-    lock_file.setStaleLockTime(30000)
 
-    if lock_file.tryLock(100):
+    # The lock is held for the whole lifetime of the application, so it must never
+    # be considered stale because of its age: staleness is only detected when the
+    # owning process is no longer running.
+    lock_file.setStaleLockTime(0)
+
+    # Do not wait: if another instance holds the lock, it will not release it soon.
+    if lock_file.tryLock(0):
         logger.info("Lock acquired: %s", lock_file_path)
         return lock_file, True
     else:
@@ -71,6 +71,7 @@ class MidiController(QObject):
 
                 # Open the new port (automatically closes the old one)
                 self._port_manager.open_input(input_name)
+                self._port_manager.invalidate()
 
                 # Start the thread
                 self._start_listening()
@@ -85,9 +86,10 @@ class MidiController(QObject):
 
                 # Close the port
                 self._port_manager.close_input()
+                self._port_manager.invalidate()
 
             except MidiConnectionError:
-                logger.warning("Could not close MIDI input", input_name)
+                logger.warning("Could not close MIDI input")
 
     def _start_listening(self) -> None:
         """Start the MIDI listener thread and emit listening_changed(True)."""
@@ -15,6 +15,7 @@
 # along with MidiWatch. If not, see <https://www.gnu.org/licenses/>.
 
 
+import shiboken6
 from PySide6.QtWidgets import (
     QDialog,
     QPushButton,
@@ -23,6 +24,7 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QHBoxLayout,
 )
+from PySide6.QtCore import Slot
 
 from midiwatch.gui.widgets.about_widget import AboutWidget
 from midiwatch.gui.widgets.credits_widget import CreditsWidget
@@ -31,6 +33,30 @@ from midiwatch.gui.widgets.credits_widget import CreditsWidget
 class AboutDialog(QDialog):
     """Dialog displaying application information and credits."""
 
+    _instance: "AboutDialog | None" = None
+
+    @classmethod
+    def instance(cls, parent=None) -> "AboutDialog":
+        """Return the shared 'About' dialog, creating it on first use.
+
+        The dialog and its pages are built once and reused each time it is shown. It
+        is reopened on its 'About' page.
+
+        Arguments:
+            parent: Parent widget of the dialog.
+
+        Returns:
+            AboutDialog: The shared dialog instance.
+        """
+        dialog = cls._instance
+        if dialog is None or not shiboken6.isValid(dialog):
+            dialog = cls._instance = cls(parent)
+        else:
+            if dialog.parent() is not parent:
+                dialog.setParent(parent, dialog.windowFlags())
+            dialog._show_about_page()
+        return dialog
+
     def __init__(self, parent=None):
         """Initialize the 'About' dialog."""
         super().__init__(parent)
@@ -68,15 +94,20 @@ class AboutDialog(QDialog):
         self._stack_layout.addWidget(about_stack)
         self._stack_layout.addWidget(credits_stack)
 
-        main_layout = QVBoxLayout()
+        main_layout = QVBoxLayout(self)
         main_layout.addLayout(button_layout)
         main_layout.addLayout(self._stack_layout)
-        self.setLayout(main_layout)
 
     def _setup_connections(self):
         """Connect signals to slots."""
         self._button_group.idClicked.connect(self._set_current_stack)
 
+    @Slot(int)
     def _set_current_stack(self, index: int) -> None:
         """Switch to the selected stack page."""
         self._stack_layout.setCurrentIndex(index)
+
+    def _show_about_page(self) -> None:
+        """Select the 'About' page and its tab button."""
+        self._button_group.button(0).setChecked(True)
+        self._set_current_stack(0)
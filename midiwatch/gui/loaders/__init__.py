@@ -1 +1,2 @@
-from .loader import initialize_resources
\ No newline at end of file
+from .loader import initialize_resources
+from .images import load_pixmap, LOGO_PATH
\ No newline at end of file
@@ -16,6 +16,7 @@
 
 import logging
 
+from PySide6.QtCore import QResource
 from PySide6.QtGui import QFontDatabase
 
 
@@ -24,15 +25,23 @@ logger = logging.getLogger(__name__)
 
 def load_font(font_path: str) -> str | None:
     """
-    Load a custom font and return its family name.
+    Load a custom font from the Qt resources and return its family name.
+
+    The font data is read straight from the compiled resource, so that Qt does not
+    have to open it as a file.
 
     Args:
-        font_path: The path to the font file.
+        font_path: The resource path of the font file (e.g. ":/fonts/Roboto.ttf").
 
     Returns:
         str | None: The family name of the loaded font, or None if loading failed.
     """
-    font_id = QFontDatabase.addApplicationFont(font_path)
+    resource = QResource(font_path)
+    if not resource.isValid():
+        logger.error("Font not found in resources: %s", font_path)
+        return None
+
+    font_id = QFontDatabase.addApplicationFontFromData(resource.uncompressedData())
     if font_id == -1:
         logger.error("Failed to load font: %s", font_path)
         return None
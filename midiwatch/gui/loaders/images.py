@@ -0,0 +1,38 @@
+# This file is part of MidiWatch.
+# Copyright (C) 2025-2026 cam84
+#
+# MidiWatch is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# MidiWatch is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with MidiWatch. If not, see <https://www.gnu.org/licenses/>.
+
+from functools import cache
+
+from PySide6.QtGui import QPixmap
+
+
+LOGO_PATH = ":/images/midiwatch-logo.svg"
+
+
+@cache
+def load_pixmap(image_path: str) -> QPixmap:
+    """Load an image from the Qt resources, once per application.
+
+    SVG images are rasterized when loaded: the cached pixmap is shared by all the
+    widgets displaying the same image (QPixmap is implicitly shared).
+
+    Args:
+        image_path: The resource path of the image file (e.g. ":/images/logo.svg").
+
+    Returns:
+        QPixmap: The loaded image.
+    """
+    return QPixmap(image_path)
@@ -14,19 +14,30 @@
 # You should have received a copy of the GNU General Public License
 # along with MidiWatch. If not, see <https://www.gnu.org/licenses/>.
 
-import os
 import logging
+import hashlib
+from functools import cache
 
 from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import QFile, QTextStream, QTimer
+from PySide6.QtCore import QResource, QTimer, QFileSystemWatcher
 
 from midiwatch.core.paths import Paths
 
 
 logger = logging.getLogger(__name__)
 
-QSS_PATH = Paths.style("main.qss")
-DEFAULT_QSS_RELOAD_INTERVAL = 500
+DEFAULT_QSS_RELOAD_DELAY = 50
+
+
+def _stylesheet_digest(data: bytes) -> bytes:
+    """Return a short digest of the stylesheet content, used to detect changes."""
+    return hashlib.blake2b(data, digest_size=8).digest()
+
+
+@cache
+def _qss_path() -> str:
+    """Return the path of the QSS source file, only needed in development mode."""
+    return Paths.style("main.qss")
 
 
 def load_stylesheet_from_resources(app: QApplication) -> None:
@@ -35,17 +46,16 @@ def load_stylesheet_from_resources(app: QApplication) -> None:
     Arguments:
         app: The QApplication instance to apply the stylesheet to.
     """
-    qss_file = QFile(":/styles/main.qss")
-    if qss_file.open(QFile.OpenModeFlag.ReadOnly | QFile.OpenModeFlag.Text):
-        text_stream = QTextStream(qss_file)
-        stylesheet = text_stream.readAll()
-        qss_file.close()
-        app.setStyleSheet(stylesheet)
-        logger.info("Stylesheet loaded: %s", qss_file.fileName())
-    else:
+    resource = QResource(":/styles/main.qss")
+    if not resource.isValid():
         logger.error(
-            "Failed to load stylesheet from resources: %s", qss_file.errorString()
+            "Failed to load stylesheet from resources: %s", resource.fileName()
         )
+        return
+
+    stylesheet = resource.uncompressedData().data().decode("utf-8")
+    app.setStyleSheet(stylesheet)
+    logger.info("Stylesheet loaded: %s", resource.fileName())
 
 
 def load_stylesheet_from_file(app: QApplication) -> None:
@@ -54,11 +64,12 @@ def load_stylesheet_from_file(app: QApplication) -> None:
     Arguments:
         app: The QApplication instance to apply the stylesheet to.
     """
+    qss_path = _qss_path()
     try:
-        with open(QSS_PATH, "r", encoding="utf-8") as f:
+        with open(qss_path, "r", encoding="utf-8") as f:
             stylesheet = f.read()
             app.setStyleSheet(stylesheet)
-            logger.info("Stylesheet loaded: %s", QSS_PATH)
+            logger.info("Stylesheet loaded: %s", qss_path)
     except FileNotFoundError as error:
         logging.error("Failed to load stylesheet from file: %s", error)
 
@@ -66,50 +77,74 @@ def load_stylesheet_from_file(app: QApplication) -> None:
 
 
 def _setup_qss_autoreload(
-    app: QApplication, interval: int = DEFAULT_QSS_RELOAD_INTERVAL
+    app: QApplication, delay: int = DEFAULT_QSS_RELOAD_DELAY
 ) -> None:
-    """Setup automatic QSS reloading by monitoring file modification time.
+    """Setup automatic QSS reloading by watching the QSS file for changes.
+
+    Change notifications are debounced so that a burst of writes (e.g. an editor
+    saving) results in a single reload.
 
     Arguments:
         app: The QApplication instance.
-        interval: Check interval in milliseconds (default: 500ms).
+        delay: Debounce delay in milliseconds (default: 50ms).
     """
 
-    # Dictionary to track the last known modification time of the QSS file
-    state: dict[str, float] = {"last_mtime": 0.0}
+    # Dictionary to track the digest of the last applied stylesheet
+    state: dict[str, bytes] = {
+        "last_digest": _stylesheet_digest(app.styleSheet().encode("utf-8"))
+    }
 
-    def check_qss_update() -> None:
-        try:
-            # Get the current modification time of the QSS file
-            mtime = os.path.getmtime(QSS_PATH)
+    qss_path = _qss_path()
+    watcher = QFileSystemWatcher([qss_path])
 
-            # Only reload if the file has been modified since last check
-            if mtime != state["last_mtime"]:
-                state["last_mtime"] = mtime
-                _reload_stylesheet(app)
-                logger.info("Stylesheet reloaded: %s", QSS_PATH)
-        except Exception as error:
-            logger.error("QSS watcher error: %s", error)
+    def reload() -> None:
+        # Editors saving atomically replace the file, which removes it from the watcher
+        if qss_path not in watcher.files() and not watcher.addPath(qss_path):
+            # The new file is not renamed over the old one yet: try again later, so
+            # that the file keeps being watched
+            logger.debug("Stylesheet file not available, retrying: %s", qss_path)
+            debounce_timer.start()
+            return
+        _reload_stylesheet(app, state)
 
-    # Create and configure the timer for periodic file checking
-    timer = QTimer()
-    timer.timeout.connect(check_qss_update)
-    timer.start(interval)
+    # Single-shot timer restarted on each change, coalescing bursts of changes
+    debounce_timer = QTimer()
+    debounce_timer.setSingleShot(True)
+    debounce_timer.setInterval(delay)
+    debounce_timer.timeout.connect(reload)
 
-    # Store a reference to the timer on the app to prevent garbage collection
-    # This keeps the timer alive for the lifetime of the application
-    app._qss_reload_timer = timer  # type: ignore[attr-defined]
+    watcher.fileChanged.connect(lambda _path: debounce_timer.start())
 
+    # Store references on the app to prevent garbage collection
+    # This keeps the watcher alive for the lifetime of the application
+    app._qss_watcher = watcher  # type: ignore[attr-defined]
+    app._qss_reload_timer = debounce_timer  # type: ignore[attr-defined]
 
-def _reload_stylesheet(app: QApplication) -> None:
+
+def _reload_stylesheet(app: QApplication, state: dict[str, bytes]) -> None:
     """Reload stylesheet from file (without setting up watcher again).
 
+    The stylesheet is only re-applied if its content changed, since applying a
+    stylesheet re-polishes every widget of the application. The raw file content is
+    compared by digest, so an unchanged file is not even decoded.
+
     Arguments:
         app: The QApplication instance to apply the stylesheet to.
+        state: Autoreload state holding the digest of the last applied stylesheet.
     """
+    qss_path = _qss_path()
     try:
-        with open(QSS_PATH, "r", encoding="utf-8") as f:
-            stylesheet = f.read()
-            app.setStyleSheet(stylesheet)
+        with open(qss_path, "rb") as f:
+            content = f.read()
     except FileNotFoundError as error:
         logger.error("Failed to reload stylesheet from file: %s", error)
+        return
+
+    digest = _stylesheet_digest(content)
+    if digest == state["last_digest"]:
+        logger.debug("Stylesheet unchanged, skipping reload: %s", qss_path)
+        return
+
+    state["last_digest"] = digest
+    app.setStyleSheet(content.decode("utf-8"))
+    logger.info("Stylesheet reloaded: %s", qss_path)
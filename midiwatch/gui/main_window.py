@@ -25,7 +25,6 @@ from PySide6.QtWidgets import (
     QFileDialog,
     QMessageBox,
 )
-from PySide6.QtGui import QPixmap
 from PySide6.QtCore import Qt, Slot, QStandardPaths, QTimer
 
 from .widgets import (
@@ -42,20 +41,29 @@ from .widgets import (
 
 from .threads import MidiListenerThread, UpdateCheckerThread
 from .controllers import MidiController
+from .loaders import load_pixmap, LOGO_PATH
 from .models import MidiMessageHumanModel, MidiMessageHexModel, MidiMessageBinaryModel
 from midiwatch.core.midi import MidiPortManager
-from midiwatch.core.exporters import CsvExporter
+from midiwatch.core.exporters import export_to_csv
 from midiwatch.constants import APP_VERSION
 
 
+# Interval at which received MIDI messages are collected from the listener (~60 Hz)
+DRAIN_INTERVAL_MS = 16
+
+
 class MainWindow(QMainWindow):
-    def __init__(self) -> None:
+    def __init__(self, ignore_timing: bool = False) -> None:
         super().__init__()
 
         self._port_manager = MidiPortManager()
         self._midi_listener = MidiListenerThread(self._port_manager)
+        self._midi_listener.set_ignore_timing(ignore_timing)
         self._midi_controller = MidiController(self._port_manager, self._midi_listener)
 
+        self._drain_timer = QTimer(self)
+        self._drain_timer.setInterval(DRAIN_INTERVAL_MS)
+
         self._human_model = MidiMessageHumanModel()
         self._hex_model = MidiMessageHexModel()
         self._binary_model = MidiMessageBinaryModel()
@@ -77,8 +85,11 @@ class MainWindow(QMainWindow):
         self.setMinimumHeight(720)
         self.setWindowFlag(Qt.WindowType.WindowMaximizeButtonHint, False)
 
+        # Suppress intermediate repaints while the widget tree is being built
+        self.setUpdatesEnabled(False)
         self._setup_ui()
         self._setup_connections()
+        self.setUpdatesEnabled(True)
 
         self.show()
 
@@ -87,7 +98,7 @@ class MainWindow(QMainWindow):
 
         # Header section: application title and MIDI status indicator
         main_title = QLabel()
-        main_title.setPixmap(QPixmap(":/images/midiwatch-logo.svg"))
+        main_title.setPixmap(load_pixmap(LOGO_PATH))
         main_title.setObjectName("mainTitle")
         self.midi_status = MidiStatus()
         header_hbox = QHBoxLayout()
@@ -138,18 +149,16 @@ class MainWindow(QMainWindow):
     def _setup_connections(self) -> None:
         """Connect signals to their respective slots."""
 
-        # Update the MIDI connection status indicator.
-        self._midi_controller.listening_changed.connect(self.midi_status.set_connected)
-
-        # Blink the MIDI activity indicator on every received MIDI message.
-        self._midi_listener.message_received.connect(
-            self.midi_status.set_activity_flashing
+        # Update the MIDI connection status indicator and collect incoming MIDI
+        # messages only while listening, from a single slot.
+        self._midi_controller.listening_changed.connect(
+            self._on_listening_changed, Qt.ConnectionType.UniqueConnection
         )
 
-        # Add incoming MIDI messages to models.
-        self._midi_listener.message_received.connect(self._human_model.add_message)
-        self._midi_listener.message_received.connect(self._hex_model.add_message)
-        self._midi_listener.message_received.connect(self._binary_model.add_message)
+        # Add incoming MIDI messages to models and blink the activity indicator.
+        self._drain_timer.timeout.connect(
+            self._drain_messages, Qt.ConnectionType.UniqueConnection
+        )
 
         # Connect port selection signal to update MIDI input configuration.
         self._port_selector.port_changed.connect(self._midi_controller.configure_input)
@@ -172,6 +181,36 @@ class MainWindow(QMainWindow):
         )
         self._update_checker.start()
 
+    @Slot(bool)
+    def _on_listening_changed(self, listening: bool) -> None:
+        """Update the connection indicator and start or stop collecting messages.
+
+        Arguments:
+            listening: True if the MIDI listener is running, False otherwise.
+        """
+        self.midi_status.set_connected(listening)
+
+        if listening:
+            self._drain_timer.start()
+        else:
+            self._drain_timer.stop()
+            # Collect the messages received before the listener stopped
+            self._drain_messages()
+
+    @Slot()
+    def _drain_messages(self) -> None:
+        """Add the MIDI messages received since the last call to all models."""
+        batch = self._midi_listener.drain()
+        if not batch:
+            return
+
+        # Blink the MIDI activity indicator on received MIDI messages.
+        self.midi_status.set_activity_flashing()
+
+        self._human_model.add_formatted_messages(batch)
+        self._hex_model.add_formatted_messages(batch)
+        self._binary_model.add_formatted_messages(batch)
+
     @Slot()
     def _clear_models(self) -> None:
         """Clear all MIDI message models."""
@@ -197,12 +236,8 @@ class MainWindow(QMainWindow):
             filter="CSV Files (*.csv)",
         )
         if filepath:
-            human_msgs = self._human_model.get_messages()
-            hex_msgs = self._hex_model.get_messages()
-            binary_msgs = self._binary_model.get_messages()
-
-            exporter = CsvExporter(filepath)
-            success = exporter.export_merged(human_msgs, hex_msgs, binary_msgs)
+            # All models share the same formatted messages, which are read in place
+            success = export_to_csv(filepath, self._human_model.iter_messages())
 
             if not success:
                 QMessageBox.critical(self, "Error", "The export failed")
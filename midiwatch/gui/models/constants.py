@@ -14,4 +14,11 @@
 # You should have received a copy of the GNU General Public License
 # along with MidiWatch. If not, see <https://www.gnu.org/licenses/>.
 
+from PySide6.QtCore import Qt
+
+
 MAX_MESSAGES = 1000
+
+# Looked up once: data() is called for every role of every visible cell, and the enum
+# attribute lookup costs more than the comparison itself
+DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
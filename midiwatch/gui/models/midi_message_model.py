@@ -0,0 +1,177 @@
+# This file is part of MidiWatch.
+# Copyright (C) 2025-2026 cam84
+#
+# MidiWatch is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# MidiWatch is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with MidiWatch. If not, see <https://www.gnu.org/licenses/>.
+
+from collections import deque
+from itertools import chain
+from typing import Callable, Iterator
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt, QObject
+
+from midiwatch.core.midi import MidiRow
+from .constants import MAX_MESSAGES, DISPLAY_ROLE
+
+
+class MidiMessageModel(QAbstractTableModel):
+    """Base table model for representing MIDI messages.
+
+    Stores up to MAX_MESSAGES formatted messages in a ring buffer. Subclasses define
+    the displayed columns and which cells of the formatted messages they display.
+
+    Attributes:
+        COLUMNS: Names of the columns, displayed in upper case in the header.
+        CELLS: Function returning the cells of a formatted message, one per column.
+    """
+
+    COLUMNS: list[str] = []
+    COLUMNS_UPPER: tuple[str, ...] = ()
+    CELLS: Callable[[MidiRow], tuple]
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.COLUMNS_UPPER = tuple(column.upper() for column in cls.COLUMNS)
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        # Ring buffer of formatted messages, the oldest one being at _head
+        self._messages = [None] * MAX_MESSAGES
+        self._head = 0
+        self._count = 0
+
+        # Messages received while paused, added when the model is resumed
+        self._pending: deque[MidiRow] = deque(maxlen=MAX_MESSAGES)
+        self._paused = False
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return self._count
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return len(self.COLUMNS)
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> str:
+        if (
+            role == Qt.ItemDataRole.DisplayRole
+            and orientation == Qt.Orientation.Horizontal
+        ):
+            return self.COLUMNS_UPPER[section]
+        return super().headerData(section, orientation, role)
+
+    def data(
+        self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole
+    ) -> str | None:
+        if role != DISPLAY_ROLE or not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        message: MidiRow = self._messages[(self._head + row) % MAX_MESSAGES]
+
+        return self.CELLS(message)[col]
+
+    def set_paused(self, paused: bool) -> None:
+        """Pause or resume the model updates.
+
+        While paused, added messages are kept aside without notifying the attached
+        views. They are added to the model when it is resumed, or when its messages
+        are read.
+
+        Arguments:
+            paused: True to pause the model updates, False to resume them.
+        """
+        self._paused = paused
+        if not paused:
+            self._add_pending_messages()
+
+    def _add_pending_messages(self) -> None:
+        """Add the messages received while the model was paused."""
+        if self._pending:
+            batch = list(self._pending)
+            self._pending.clear()
+
+            paused = self._paused
+            self._paused = False
+            self.add_formatted_messages(batch)
+            self._paused = paused
+
+    def add_formatted_messages(self, batch: list[MidiRow]) -> None:
+        """Append a batch of already formatted MIDI messages to the model.
+
+        Messages are inserted as new rows until MAX_MESSAGES is reached. Past that,
+        they overwrite the oldest messages in place and the rows are reported as
+        changed, so that attached views are notified at most twice per batch.
+
+        Arguments:
+            batch: Formatted messages, as returned by format_message_all().
+        """
+        if not batch:
+            return
+
+        if self._paused:
+            self._pending.extend(batch)
+            return
+
+        # Messages that would be removed right away are not inserted
+        batch = batch[-MAX_MESSAGES:]
+
+        messages = self._messages
+        free = MAX_MESSAGES - self._count
+
+        if free > 0:
+            inserted = batch[:free]
+            row = self._count
+            self.beginInsertRows(QModelIndex(), row, row + len(inserted) - 1)
+            for formatted in inserted:
+                messages[(self._head + self._count) % MAX_MESSAGES] = formatted
+                self._count += 1
+            self.endInsertRows()
+            batch = batch[free:]
+
+        if batch:
+            head = self._head
+            for formatted in batch:
+                messages[head] = formatted
+                head = (head + 1) % MAX_MESSAGES
+            self._head = head
+            self.dataChanged.emit(
+                self.index(0, 0), self.index(self._count - 1, len(self.COLUMNS) - 1)
+            )
+
+    def iter_messages(self) -> Iterator[MidiRow]:
+        """Iterate over all stored messages in place, oldest first, without copying.
+
+        The model must not be modified during the iteration.
+
+        Returns:
+            Iterator[MidiRow]: Iterator of formatted messages
+        """
+        self._add_pending_messages()
+        end = self._head + self._count
+        slots = chain(
+            range(self._head, min(end, MAX_MESSAGES)),
+            range(max(0, end - MAX_MESSAGES)),
+        )
+        return map(self._messages.__getitem__, slots)
+
+    def clear(self) -> None:
+        """Remove all stored MIDI messages from the model."""
+        self.beginResetModel()
+        self._messages = [None] * MAX_MESSAGES
+        self._head = 0
+        self._count = 0
+        self._pending.clear()
+        self.endResetModel()
@@ -15,33 +15,55 @@
 # along with MidiWatch. If not, see <https://www.gnu.org/licenses/>.
 
 import logging
+from collections import deque
+from functools import partial
 
-from PySide6.QtCore import QThread, Signal
+from PySide6.QtCore import Qt, QThread, QTimer
 
 from mido.messages import Message
-from midiwatch.core.midi import MidiPortManager, MidiConnectionError
+from midiwatch.core.midi import (
+    MidiPortManager,
+    MidiConnectionError,
+    MidiMessageFormatter,
+    MidiRow,
+    decode_message_bytes,
+)
 
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of formatted messages waiting to be drained, the oldest ones are
+# dropped beyond that
+QUEUE_MAX_SIZE = 2048
+
+# Message types of the MIDI timing events (clock, MTC), which can be ignored
+TIMING_TYPES = frozenset({"clock", "quarter_frame"})
+
+# Interval (in milliseconds) between two polls of input ports without callback support
+POLL_INTERVAL_MS = 10
+
 
 class MidiListenerThread(QThread):
     """Background thread for listening to incoming MIDI messages.
 
-    This thread continuously polls the MIDI input port for incoming messages and emits
-    them via Qt signals.
+    While running, this thread registers a callback on the MIDI input port, so that
+    incoming messages are collected without polling. Ports of mido backends without
+    callback support are polled with iter_pending() instead. Messages are formatted in the
+    MIDI backend thread and pushed to a bounded queue, which the GUI thread empties
+    periodically with drain(). No Qt signal is emitted per message.
 
-    Signals:
-        message_received (dict): Emitted when a MIDI message is received.
-            The dict contains the message data and raw bytes.
+    The queue has a single producer (the MIDI backend callback) and a single consumer
+    (the GUI thread): deque.append() and deque.popleft() are atomic, so it needs no
+    lock.
 
     Attributes:
         _port_manager (MidiPortManager): Manager providing access to the MIDI
             input port.
+        _formatter (MidiMessageFormatter): Formatter of the received messages.
+        _queue (deque): Formatted messages waiting to be drained.
+        _ignore_timing (bool): Whether MIDI timing events are dropped.
     """
 
-    message_received = Signal(dict)
-
     def __init__(self, port_manager: MidiPortManager) -> None:
         """Initialize the MIDI listener thread.
 
@@ -50,39 +72,154 @@ class MidiListenerThread(QThread):
         """
         super().__init__()
         self._port_manager = port_manager
+        self._formatter = MidiMessageFormatter()
+        self._queue = deque(maxlen=QUEUE_MAX_SIZE)
+        self._ignore_timing = False
         logger.debug("MidiListenerThread initialized")
 
     def run(self):
         """Main thread loop for listening to MIDI messages.
 
-        Continuously polls the MIDI input port for pending messages and emits them via
-        the message_received signal. The loop runs until an interruption is requested or
-        a MidiConnectionError occurs.
+        Registers the message callback on the MIDI input port, then runs the thread
+        event loop until stop() is called. With the rtmidi backend, the callback is
+        registered on the underlying rtmidi input, so that raw messages are decoded
+        without going through mido Message objects. Ports that don't support callbacks
+        are polled from a timer of the thread event loop. The callback is removed
+        before returning. If the input port is not configured, the thread returns
+        immediately.
         """
+        try:
+            input_port = self._port_manager.input_port
+        except MidiConnectionError:
+            return
+
         logger.info("MidiListenerThread is running")
 
-        while not self.isInterruptionRequested():
-            try:
-                for msg in self._port_manager.input_port.iter_pending():
-                    msg: Message
-                    msg_data = msg.dict().copy()
-                    msg_data["bytes"] = msg.bytes()
-                    self.message_received.emit(msg_data)
+        rtmidi_input = self._port_manager.rtmidi_input
+        # Only some mido ports (rtmidi, portmidi) define a callback property: on the
+        # others, setting the attribute would neither deliver messages nor allow
+        # polling
+        has_callback = isinstance(getattr(type(input_port), "callback", None), property)
+        poll_timer = None
+
+        if rtmidi_input is not None:
+            self._apply_ignored_types(rtmidi_input, self._ignore_timing)
+            rtmidi_input.set_callback(self._on_raw_message)
+        elif has_callback:
+            input_port.callback = self._on_message
+        else:
+            # The timer lives in this thread, the direct connection keeps the polling
+            # out of the GUI thread, which owns the QThread object
+            poll_timer = QTimer()
+            poll_timer.setInterval(POLL_INTERVAL_MS)
+            poll_timer.timeout.connect(
+                partial(self._poll_pending, input_port),
+                Qt.ConnectionType.DirectConnection,
+            )
+            poll_timer.start()
+        try:
+            self.exec()
+        finally:
+            if poll_timer is not None:
+                poll_timer.stop()
+            elif rtmidi_input is not None or has_callback:
+                # Also gives the rtmidi input back to mido, with its default filters
+                input_port.callback = None
+            if rtmidi_input is not None:
+                self._apply_ignored_types(rtmidi_input, False)
+
+    def set_ignore_timing(self, ignore: bool) -> None:
+        """Set whether MIDI timing events (clock, MTC quarter frames) are dropped.
+
+        Timing events are sent continuously by many devices, even when idle. With the
+        rtmidi backend, they are dropped by rtmidi itself, before reaching Python.
+        Takes effect immediately, even while the thread is running.
+
+        Arguments:
+            ignore: True to drop timing events, False to display them.
+        """
+        self._ignore_timing = ignore
+
+        rtmidi_input = self._port_manager.rtmidi_input
+        if rtmidi_input is not None and self.isRunning():
+            self._apply_ignored_types(rtmidi_input, ignore)
+
+    @staticmethod
+    def _apply_ignored_types(rtmidi_input, ignore_timing: bool) -> None:
+        """Set the message types dropped by an rtmidi input.
+
+        SysEx messages are kept and Active Sensing messages are dropped, as mido does.
+
+        Arguments:
+            rtmidi_input: The rtmidi input to configure.
+            ignore_timing: Whether timing events are dropped.
+        """
+        rtmidi_input.ignore_types(sysex=False, timing=ignore_timing, active_sense=True)
+
+    def drain(self) -> list[MidiRow]:
+        """Remove and return the formatted messages received since the last call.
+
+        Returns:
+            list[MidiRow]: Formatted messages, oldest first.
+        """
+        # The producer only appends, the queue holds at least as many messages
+        popleft = self._queue.popleft
+        return [popleft() for _ in range(len(self._queue))]
+
+    def _on_message(self, msg: Message) -> None:
+        """Queue a received MIDI message.
+
+        Called by the mido backend from its own thread when the rtmidi input is not
+        available, or by _poll_pending() from this thread.
+
+        Arguments:
+            msg: The received MIDI message.
+        """
+        # The message attributes are copied in a single dict built from vars(), which
+        # skips the conversion of SysEx data to a list done by Message.dict(): the
+        # formatter only needs its length.
+        if self._ignore_timing and msg.type in TIMING_TYPES:
+            return
+
+        msg_data = dict(vars(msg), bytes=msg.bytes())
+        self._queue.append(self._formatter.format_message_all(msg_data))
+
+    def _poll_pending(self, input_port) -> None:
+        """Queue the messages pending on an input port without callback support.
 
-            except MidiConnectionError:
-                break
+        Arguments:
+            input_port: The polled MIDI input port.
+        """
+        for msg in input_port.iter_pending():
+            self._on_message(msg)
+
+    def _on_raw_message(self, event: tuple[list[int], float], data: object) -> None:
+        """Queue a raw MIDI message received from rtmidi.
+
+        Called by rtmidi from its own thread. Invalid messages are ignored, as mido
+        does.
+
+        Arguments:
+            event: The message bytes and the delta time since the previous message.
+            data: User data registered with the callback (unused).
+        """
+        try:
+            msg_data = decode_message_bytes(event[0])
+        except ValueError:
+            return
 
-            self.msleep(10)
+        self._queue.append(self._formatter.format_message_all(msg_data))
 
     def stop(self):
-        """Request the thread to stop and wait for it to finish.
+        """Stop the thread and wait for it to finish.
 
         If the thread is not running, this method returns immediately. Otherwise, it
-        requests interruption and blocks until the thread has fully terminated.
+        stops the thread with quit(), which ends the event loop run() is blocked in,
+        and blocks until the thread has fully terminated.
         """
         if not self.isRunning():
             return
 
-        self.requestInterruption()
+        self.quit()
         self.wait()
         logger.info("MidiListenerThread stopped")
@@ -14,18 +14,72 @@
 # You should have received a copy of the GNU General Public License
 # along with MidiWatch. If not, see <https://www.gnu.org/licenses/>.
 
-import requests, logging
+import requests, logging, json
 
+from packaging.version import Version, InvalidVersion
 from PySide6.QtCore import QThread, Signal
 
 from midiwatch.constants import GITHUB_OWNER, APP_NAME, APP_VERSION
+from midiwatch.core.paths import Paths
 
 logger = logging.getLogger(__name__)
 
+# File caching the latest release information along with its ETag
+RELEASE_CACHE_FILENAME = "latest_release.json"
+
+# Connect and read timeouts of the GitHub API requests, in seconds
+REQUEST_TIMEOUT = (3, 7)
+
+# Keys of the release information kept in the cache
+_RELEASE_KEYS = ("tag_name", "html_url", "name")
+
+_session = requests.Session()
+
+
+def _load_release_cache() -> dict:
+    """Load the cached latest release information.
+
+    Returns:
+        Dictionary with the cached release info and its ETag, empty if there is no
+        usable cache.
+    """
+    try:
+        with open(Paths.cache(RELEASE_CACHE_FILENAME), encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError) as error:
+        logger.debug("No usable release cache: %s", error)
+        return {}
+
+    if not isinstance(cache, dict):
+        return {}
+    if not cache.get("etag") or not cache.get("tag_name"):
+        return {}
+    return cache
+
+
+def _save_release_cache(etag: str, release: dict) -> None:
+    """Save the latest release information along with its ETag.
+
+    Arguments:
+        etag: ETag of the GitHub API response.
+        release: Release info returned by get_latest_release().
+    """
+    cache = {key: release.get(key) for key in _RELEASE_KEYS}
+    cache["etag"] = etag
+    try:
+        with open(Paths.cache(RELEASE_CACHE_FILENAME), "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+    except OSError as error:
+        logger.debug("Failed to save release cache: %s", error)
+
 
 def get_latest_release(owner: str = GITHUB_OWNER, repo: str = APP_NAME) -> dict:
     """Fetch the latest release information from GitHub API.
 
+    The ETag of the last response is sent back, so that GitHub answers with an empty
+    304 response when the latest release has not changed: the cached release info is
+    then returned.
+
     Arguments:
         owner: GitHub repository owner username.
         repo: GitHub repository name.
@@ -39,22 +93,39 @@ def get_latest_release(owner: str = GITHUB_OWNER, repo: str = APP_NAME) -> dict:
         "User-Agent": f"{APP_NAME}/{APP_VERSION}",
     }
 
+    cache = _load_release_cache()
+    if cache:
+        headers["If-None-Match"] = cache["etag"]
+
     logger.debug("Fetching latest release from GitHub: %s/%s", owner, repo)
 
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        response = _session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+
+        if cache and response.status_code == requests.codes.not_modified:
+            logger.info("Latest release unchanged: %s", cache["tag_name"])
+            release = {key: cache.get(key) for key in _RELEASE_KEYS}
+            release["success"] = True
+            return release
+
         response.raise_for_status()
         data: dict = response.json()
 
         tag_name = data.get("tag_name")
         logger.info("Latest release fetched successfully: %s", tag_name)
 
-        return {
+        release = {
             "tag_name": tag_name,
             "html_url": data.get("html_url"),
             "name": data.get("name"),
             "success": True,
         }
+
+        etag = response.headers.get("ETag")
+        if etag and tag_name:
+            _save_release_cache(etag, release)
+
+        return release
     except requests.exceptions.RequestException as error:
         logger.warning("Failed to fetch latest release: %s", error)
         return {
@@ -71,14 +142,21 @@ def is_update_available(local_version: str, remote_version: str) -> bool:
         local_version: Current application version.
 
     Returns:
-       True if remote version is newer, False otherwise.
+       True if remote version is newer, False otherwise (also if a version cannot be
+       parsed).
     """
     if not remote_version:
         return False
 
     normalized_remote_version = remote_version.lstrip("v")
 
-    return normalized_remote_version > local_version
+    try:
+        return Version(normalized_remote_version) > Version(local_version)
+    except InvalidVersion:
+        logger.warning(
+            "Cannot compare versions: %s, %s", normalized_remote_version, local_version
+        )
+        return False
 
 
 class UpdateCheckerThread(QThread):
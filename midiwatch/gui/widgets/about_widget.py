@@ -15,9 +15,10 @@
 # along with MidiWatch. If not, see <https://www.gnu.org/licenses/>.
 
 from PySide6.QtWidgets import QWidget, QLabel, QVBoxLayout
-from PySide6.QtGui import QPixmap, QDesktopServices
-from PySide6.QtCore import Qt, QUrl
+from PySide6.QtGui import QDesktopServices
+from PySide6.QtCore import Qt, QUrl, Slot
 
+from midiwatch.gui.loaders import load_pixmap, LOGO_PATH
 from midiwatch.constants import (
     APP_VERSION,
     APP_DESCRIPTION,
@@ -41,7 +42,7 @@ class AboutWidget(QWidget):
     def _setup_ui(self):
         """Create and arrange child widgets."""
         icon_lbl = QLabel()
-        icon_lbl.setPixmap(QPixmap(":/images/midiwatch-logo.svg"))
+        icon_lbl.setPixmap(load_pixmap(LOGO_PATH))
 
         version_lbl = QLabel(APP_VERSION)
         version_lbl.setProperty("class", "dialogText")
@@ -63,7 +64,7 @@ class AboutWidget(QWidget):
         self._licence_lbl.setOpenExternalLinks(False)
         self._licence_lbl.setProperty("class", "dialogText")
 
-        layout_vbox = QVBoxLayout()
+        layout_vbox = QVBoxLayout(self)
         layout_vbox.addStretch()
 
         # Icon + version
@@ -89,13 +90,12 @@ class AboutWidget(QWidget):
 
         layout_vbox.addStretch()
 
-        self.setLayout(layout_vbox)
-
     def _setup_connections(self):
         """Connect signals to their respective slots."""
         self._github_repo_lbl.linkActivated.connect(self._open_link)
         self._licence_lbl.linkActivated.connect(self._open_link)
 
+    @Slot(str)
     def _open_link(self, url: str) -> None:
         """Open an external link in the default browser."""
         QDesktopServices.openUrl(QUrl(url))
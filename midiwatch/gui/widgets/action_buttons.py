@@ -41,15 +41,13 @@ class ActionButtons(QWidget):
     def _setup_ui(self):
         """Create and arrange child widgets."""
         clear_lbtn = LabeledButton("CLEAR")
-        clear_lbtn.clicked.connect(self.clear_clicked.emit)
+        clear_lbtn.clicked.connect(self.clear_clicked)
 
         export_lbtn = LabeledButton("EXPORT")
-        export_lbtn.clicked.connect(self.export_clicked.emit)
+        export_lbtn.clicked.connect(self.export_clicked)
 
-        layout_hbox = QHBoxLayout()
+        layout_hbox = QHBoxLayout(self)
         layout_hbox.setContentsMargins(0, 0, 0, 0)
         layout_hbox.setSpacing(16)
         layout_hbox.addWidget(clear_lbtn)
         layout_hbox.addWidget(export_lbtn)
-
-        self.setLayout(layout_hbox)
@@ -54,7 +54,5 @@ class CreditsWidget(QWidget):
         credits_pte.setPlainText(credits_txt)
         credits_pte.setObjectName("creditsPlainText")
 
-        layout_vbox = QVBoxLayout()
+        layout_vbox = QVBoxLayout(self)
         layout_vbox.addWidget(credits_pte)
-
-        self.setLayout(layout_vbox)
@@ -25,7 +25,6 @@ from PySide6.QtWidgets import (
 from PySide6.QtGui import QDesktopServices
 from PySide6.QtCore import Qt, QUrl, Slot
 
-from midiwatch.gui.dialogs import AboutDialog
 from midiwatch.constants import APP_NAME, APP_VERSION
 
 
@@ -37,6 +36,10 @@ class FooterWidget(QWidget):
         super().__init__(parent)
         self.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
         self.setObjectName("footer")
+
+        # Created on the first update notification, which most sessions never get
+        self._update_btn: QPushButton | None = None
+
         self._setup_ui()
         self._setup_connections()
 
@@ -44,16 +47,6 @@ class FooterWidget(QWidget):
         """Create and arrange child widgets."""
         version_lbl = QLabel(f"{APP_NAME} v{APP_VERSION}")
 
-        # Separator 1 (hidden by default, visible if updated)
-        self._separator_update = QLabel("/")
-        self._separator_update.hide()
-
-        self._update_btn = QPushButton()
-        self._update_btn.setObjectName("updateNotification")
-        self._update_btn.setFlat(True)
-        self._update_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self._update_btn.hide()
-
         separator_lbl = QLabel("/")
 
         self._about_btn = QPushButton("about")
@@ -61,20 +54,45 @@ class FooterWidget(QWidget):
         self._about_btn.setFlat(True)
         self._about_btn.setCursor(Qt.CursorShape.PointingHandCursor)
 
-        layout_hbox = QHBoxLayout()
-        layout_hbox.setContentsMargins(0, 5, 0, 5)
-        layout_hbox.addWidget(version_lbl, alignment=Qt.AlignmentFlag.AlignVCenter)
-        layout_hbox.addWidget(
-            self._separator_update, alignment=Qt.AlignmentFlag.AlignVCenter
+        self._layout_hbox = QHBoxLayout(self)
+        self._layout_hbox.setContentsMargins(0, 5, 0, 5)
+        self._layout_hbox.addWidget(
+            version_lbl, alignment=Qt.AlignmentFlag.AlignVCenter
+        )
+        self._layout_hbox.addWidget(
+            separator_lbl, alignment=Qt.AlignmentFlag.AlignVCenter
         )
-        layout_hbox.addWidget(self._update_btn, alignment=Qt.AlignmentFlag.AlignCenter)
-        layout_hbox.addWidget(separator_lbl, alignment=Qt.AlignmentFlag.AlignVCenter)
-        layout_hbox.addWidget(self._about_btn, alignment=Qt.AlignmentFlag.AlignVCenter)
-        self.setLayout(layout_hbox)
+        self._layout_hbox.addWidget(
+            self._about_btn, alignment=Qt.AlignmentFlag.AlignVCenter
+        )
+
+    def _setup_update_notification(self) -> QPushButton:
+        """Create the update notification button and its separator.
+
+        They are inserted after the version label.
+
+        Returns:
+            QPushButton: The update notification button.
+        """
+        separator_update = QLabel("/")
+
+        update_btn = QPushButton()
+        update_btn.setObjectName("updateNotification")
+        update_btn.setFlat(True)
+        update_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        update_btn.clicked.connect(self._open_update_link)
+
+        self._layout_hbox.insertWidget(
+            1, separator_update, alignment=Qt.AlignmentFlag.AlignVCenter
+        )
+        self._layout_hbox.insertWidget(
+            2, update_btn, alignment=Qt.AlignmentFlag.AlignCenter
+        )
+
+        return update_btn
 
     def _setup_connections(self):
         """Connect signals to their respective slots."""
-        self._update_btn.clicked.connect(self._open_update_link)
         self._about_btn.clicked.connect(self._on_about_clicked)
 
     @Slot(str, str)
@@ -85,17 +103,22 @@ class FooterWidget(QWidget):
             version: New version number.
             url: GitHub release page URL.
         """
+        if self._update_btn is None:
+            self._update_btn = self._setup_update_notification()
+
         self._update_btn.setText(f"New ! {version}")
         self._update_url = url
-        self._update_btn.show()
-        self._separator_update.show()
 
     @Slot()
     def _on_about_clicked(self) -> None:
-        """Open the About dialog."""
-        parent = self.window()
-        dialog = AboutDialog(parent)
-        dialog.exec()
+        """Open the About dialog.
+
+        The dialog module and its pages are only imported on first use, so that they
+        cost nothing at startup. The dialog itself is then reused.
+        """
+        from midiwatch.gui.dialogs import AboutDialog
+
+        AboutDialog.instance(self.window()).exec()
 
     @Slot()
     def _open_update_link(self) -> None:
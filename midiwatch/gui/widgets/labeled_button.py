@@ -47,15 +47,13 @@ class LabeledButton(QWidget):
         self.button = QPushButton()
         self.button.setFixedSize(button_size, button_size)
         self.button.setProperty("class", "squareButton")
-        self.button.clicked.connect(self.clicked.emit)
+        self.button.clicked.connect(self.clicked)
 
-        layout_vbox = QVBoxLayout()
+        layout_vbox = QVBoxLayout(self)
         layout_vbox.setContentsMargins(0, 0, 0, 0)
         layout_vbox.addWidget(label, alignment=Qt.AlignmentFlag.AlignCenter)
         layout_vbox.addWidget(self.button, alignment=Qt.AlignmentFlag.AlignCenter)
 
-        self.setLayout(layout_vbox)
-
     def set_checkable(self, checkable: bool) -> None:
         """Set whether the button is checkable (toggleable)."""
         self.button.setCheckable(checkable)
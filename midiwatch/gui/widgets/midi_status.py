@@ -16,81 +16,113 @@
 
 import logging
 
-from PySide6.QtWidgets import QWidget, QLabel, QHBoxLayout, QVBoxLayout, QSizePolicy
-from PySide6.QtGui import QPaintEvent, QPainter, QBrush, QColor, QPen
-from PySide6.QtCore import Qt, Slot, QTimer, QSize
+from PySide6.QtWidgets import (
+    QWidget,
+    QLabel,
+    QHBoxLayout,
+    QVBoxLayout,
+    QSizePolicy,
+    QSpacerItem,
+    QStyle,
+)
+from PySide6.QtGui import QPaintEvent, QPainter, QColor, QPixmap
+from PySide6.QtCore import Qt, Slot, SLOT, QTimer, QSize, QRect, QPoint
 
 
 logger = logging.getLogger(__name__)
 
 
-class _IndicatorLight(QWidget):
-    """A custom LED-style indicator light widget.
+class _IndicatorLight:
+    """A LED-style indicator light drawn by its parent MidiStatus widget.
 
-    Renders a rounded light that can be toggled between active/inactive states or
-    flashed for visual feedback.
+    Renders a rounded light that can be toggled between active/inactive states. The
+    light takes the place of a spacer in the layout of its parent. As it has a fixed
+    size and two states, each state is rendered once to a pixmap, which is then drawn
+    on every repaint.
     """
 
-    FLASH_DURATION = 90  # milliseconds
+    __slots__ = (
+        "_colors",
+        "_size",
+        "_pixmaps",
+        "_pixmaps_ratio",
+        "is_active",
+        "spacer",
+    )
 
     def __init__(
         self, active_color: QColor, inactive_color: QColor, size: QSize = QSize(28, 10)
     ) -> None:
-        super().__init__()
+        # Color of the light, keyed by active state
+        self._colors = {True: active_color, False: inactive_color}
+        self._size = size
+        self.is_active = False
+        self.spacer = QSpacerItem(
+            size.width(),
+            size.height(),
+            QSizePolicy.Policy.Fixed,
+            QSizePolicy.Policy.Fixed,
+        )
 
-        self._active_color = active_color
-        self._inactive_color = inactive_color
-        self._is_active = False
-        self._flash_timer = QTimer()
+        # Rendered states, keyed by active state, for the device pixel ratio below
+        self._pixmaps: dict[bool, QPixmap] = {}
+        self._pixmaps_ratio = 0.0
 
-        self.setFixedSize(size)
+    @property
+    def rect(self) -> QRect:
+        """Get the area of the light in its parent, vertically centered in its row.
 
-    def paintEvent(self, event: QPaintEvent) -> None:
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        Returns:
+            QRect: The area of the light.
+        """
+        geometry = self.spacer.geometry()
+        rect = QRect(geometry.topLeft(), self._size)
+        rect.moveTop(geometry.top() + (geometry.height() - self._size.height()) // 2)
+        return rect
 
-        color = self._active_color if self._is_active else self._inactive_color
+    def pixmap(self, ratio: float) -> QPixmap:
+        """Get the rendered light in its current state.
+
+        Arguments:
+            ratio: Device pixel ratio of the screen displaying the light.
 
-        pen = QPen(Qt.PenStyle.NoPen)
-        brush = QBrush()
-        brush.setColor(QColor(color.darker()))
-        brush.setStyle(Qt.BrushStyle.SolidPattern)
+        Returns:
+            QPixmap: The rendered light, with a transparent background.
+        """
+        if ratio != self._pixmaps_ratio:
+            self._pixmaps.clear()
+            self._pixmaps_ratio = ratio
 
-        painter.setBrush(brush)
-        painter.setPen(pen)
-        painter.drawRoundedRect(self.rect(), self.height() / 2, self.width() / 2)
+        pixmap = self._pixmaps.get(self.is_active)
+        if pixmap is None:
+            pixmap = self._pixmaps[self.is_active] = self._render(ratio)
+        return pixmap
 
-        brush.setColor(QColor(color))
-        painter.setBrush(brush)
+    def _render(self, ratio: float) -> QPixmap:
+        """Render the light in its current state.
 
-        rect = self.rect()
-        padding = 0
+        Arguments:
+            ratio: Device pixel ratio of the screen displaying the light.
 
-        inner_rect = rect.adjusted(padding, padding, -padding, -padding)
-        radius_x = (self.height() - 2 * padding) / 2
-        radius_y = (self.width() - 2 * padding) / 2
-        painter.drawRoundedRect(inner_rect, radius_x, radius_y)
+        Returns:
+            QPixmap: The rendered light, with a transparent background.
+        """
+        pixmap = QPixmap(self._size * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
 
-    @Slot()
-    def activate(self) -> None:
-        self._is_active = True
-        self.update()
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-    @Slot()
-    def deactivate(self) -> None:
-        self._is_active = False
-        self.update()
+        width = self._size.width()
+        height = self._size.height()
 
-    @Slot()
-    def flashing(self) -> None:
-        if not self._flash_timer.isActive():
-            self._is_active = True
-            self.update()
-            self._flash_timer.singleShot(self.FLASH_DURATION, self._stop_flashing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self._colors[self.is_active])
+        painter.drawRoundedRect(QRect(QPoint(0, 0), self._size), height / 2, width / 2)
+        painter.end()
 
-    def _stop_flashing(self) -> None:
-        self._is_active = False
-        self.update()
+        return pixmap
 
 
 class MidiStatus(QWidget):
@@ -99,10 +131,20 @@ class MidiStatus(QWidget):
     Shows two LED lights: one for MIDI device connection (red/green) and one for
     incoming MIDI activity (dim/bright cyan). Provides methods to update connection
     state and signal activity pulses.
+
+    Both lights are drawn by this widget, rather than being child widgets, and a
+    state change only repaints the area of the changed light.
     """
 
+    FLASH_DURATION = 90  # milliseconds
+
     def __init__(self) -> None:
         super().__init__()
+
+        # While a flash is pending, further flash requests are ignored, so that a
+        # stream of MIDI activity repaints the light at most twice per FLASH_DURATION.
+        self._flash_pending = False
+
         self.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
         self._setup_ui()
         logger.debug("MidiStatus initialized")
@@ -121,22 +163,47 @@ class MidiStatus(QWidget):
             inactive_color=QColor("#00D9FF").darker(250), active_color=QColor("#00D9FF")
         )
 
+        # Layouts add no spacing next to spacer items, so the spacing a light widget
+        # would get is added explicitly
+        spacing = self.style().pixelMetric(
+            QStyle.PixelMetric.PM_LayoutHorizontalSpacing
+        )
+
         connection_hbox = QHBoxLayout()
         connection_hbox.setContentsMargins(0, 0, 0, 0)
         connection_hbox.addWidget(connection_lbl, alignment=Qt.AlignmentFlag.AlignRight)
-        connection_hbox.addWidget(self._connection_light)
+        connection_hbox.addSpacing(spacing)
+        connection_hbox.addItem(self._connection_light.spacer)
 
         activity_hbox = QHBoxLayout()
         activity_hbox.setContentsMargins(0, 0, 0, 0)
         activity_hbox.addWidget(activity_lbl, alignment=Qt.AlignmentFlag.AlignRight)
-        activity_hbox.addWidget(self._activity_light)
+        activity_hbox.addSpacing(spacing)
+        activity_hbox.addItem(self._activity_light.spacer)
 
-        main_vbox = QVBoxLayout()
+        main_vbox = QVBoxLayout(self)
         main_vbox.setContentsMargins(0, 0, 0, 0)
         main_vbox.addLayout(connection_hbox)
         main_vbox.addLayout(activity_hbox)
 
-        self.setLayout(main_vbox)
+    def paintEvent(self, event: QPaintEvent) -> None:
+        ratio = self.devicePixelRatioF()
+        painter = QPainter(self)
+
+        for light in (self._connection_light, self._activity_light):
+            rect = light.rect
+            if event.rect().intersects(rect):
+                painter.drawPixmap(rect.topLeft(), light.pixmap(ratio))
+
+    def _set_light_active(self, light: _IndicatorLight, active: bool) -> None:
+        """Change the state of a light and repaint it.
+
+        Arguments:
+            light: The light to change.
+            active: True to turn the light on, False to turn it off.
+        """
+        light.is_active = active
+        self.update(light.rect)
 
     @Slot(bool)
     def set_connected(self, connected: bool) -> None:
@@ -147,12 +214,28 @@ class MidiStatus(QWidget):
         """
         if connected:
             logger.info("MIDI connection indicator: ON")
-            self._connection_light.activate()
         else:
             logger.info("MIDI connection indicator: OFF")
-            self._connection_light.deactivate()
+        self._set_light_active(self._connection_light, connected)
 
     @Slot()
     def set_activity_flashing(self) -> None:
         """Flash the activity indicator to signal incoming MIDI activity."""
-        self._activity_light.flashing()
+        if self._flash_pending:
+            return
+
+        self._flash_pending = True
+        self._set_light_active(self._activity_light, True)
+        # The light can be turned off a few milliseconds late, so a coarse timer is
+        # enough. Only this overload accepts a timer type, hence the slot signature.
+        QTimer.singleShot(
+            self.FLASH_DURATION,
+            Qt.TimerType.CoarseTimer,
+            self,
+            SLOT("_stop_flashing()"),
+        )
+
+    @Slot()
+    def _stop_flashing(self) -> None:
+        self._flash_pending = False
+        self._set_light_active(self._activity_light, False)
@@ -26,6 +26,9 @@ from midiwatch.core.midi import MidiPortManager
 
 logger = logging.getLogger(__name__)
 
+# Interval (in milliseconds) between two checks of the available MIDI input ports.
+PORT_REFRESH_INTERVAL_MS = 5000
+
 
 class PortSelector(QWidget):
     """Widget for selecting MIDI input ports with automatic refresh."""
@@ -42,8 +45,11 @@ class PortSelector(QWidget):
 
         self._port_manager = port_manager
 
-        self._timer = QTimer()
-        self._timer.setInterval(3000)
+        # Neither mido nor python-rtmidi report device changes, so the ports are
+        # polled. A very coarse timer lets Qt align these wakeups with others.
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.VeryCoarseTimer)
+        self._timer.setInterval(PORT_REFRESH_INTERVAL_MS)
         self._timer.start()
 
         self.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
@@ -62,41 +68,61 @@ class PortSelector(QWidget):
         self._midi_input_cbb.setProperty("class", "comboBox")
         self._populate_port_list()
 
-        layout_hbox = QVBoxLayout()
+        layout_hbox = QVBoxLayout(self)
         layout_hbox.setContentsMargins(0, 0, 0, 0)
         layout_hbox.addWidget(midi_input_lbl, alignment=Qt.AlignmentFlag.AlignCenter)
         layout_hbox.addWidget(self._midi_input_cbb)
-        self.setLayout(layout_hbox)
 
     def _setup_connections(self) -> None:
         """Connect signals to their respective slots."""
         self._timer.timeout.connect(self._sync_port_selection)
-        self._midi_input_cbb.currentTextChanged.connect(self.port_changed.emit)
+        self._midi_input_cbb.currentTextChanged.connect(self.port_changed)
 
     def _populate_port_list(self) -> None:
         """Fill the combo box with NO_DEVICE_TEXT and available port names."""
+        self._port_names = tuple(self._port_manager.input_names)
         self._midi_input_cbb.clear()
-        self._midi_input_cbb.addItems([NO_DEVICE_TEXT] + self._port_manager.input_names)
+        self._midi_input_cbb.addItems([NO_DEVICE_TEXT, *self._port_names])
+
+    def _patch_port_list(self) -> None:
+        """Update the combo box items to NO_DEVICE_TEXT and the last port names.
+
+        Only the items that differ are removed or inserted, so that the unchanged
+        items, and the popup rows displaying them, are kept.
+        """
+        combo_box = self._midi_input_cbb
+        items = (NO_DEVICE_TEXT, *self._port_names)
+        wanted = set(items)
+
+        for i in reversed(range(combo_box.count())):
+            if combo_box.itemText(i) not in wanted:
+                combo_box.removeItem(i)
+
+        for i, text in enumerate(items):
+            if combo_box.itemText(i) != text:
+                combo_box.insertItem(i, text)
+
+        # Items left after the wanted ones were moved by a reordering
+        while combo_box.count() > len(items):
+            combo_box.removeItem(combo_box.count() - 1)
 
     @Slot()
     def _sync_port_selection(self) -> None:
         """Refresh port list when the available ports change."""
-        existing = [
-            self._midi_input_cbb.itemText(i)
-            for i in range(1, self._midi_input_cbb.count())
-        ]
+        port_names = tuple(self._port_manager.input_names)
 
-        if existing != self._port_manager.input_names:
+        if port_names != self._port_names:
             logger.debug("Port list changed, syncing ComboBox")
 
+            self._port_names = port_names
             current = self._midi_input_cbb.currentText()
             self._midi_input_cbb.blockSignals(True)
-            self._populate_port_list()
+            self._patch_port_list()
 
             if current == NO_DEVICE_TEXT:
                 index = self._midi_input_cbb.findText(NO_DEVICE_TEXT)
                 logger.debug("'No device' still selected, no change needed.")
-            elif current in self._port_manager.input_names:
+            elif current in port_names:
                 index = self._midi_input_cbb.findText(current)
                 logger.debug("Port '%s' still available, keeping selection", current)
             else:
@@ -21,7 +21,7 @@ from PySide6.QtWidgets import (
     QAbstractItemView,
     QStackedLayout,
 )
-from PySide6.QtCore import Qt, Slot
+from PySide6.QtCore import Qt, Slot, QTimer
 
 from midiwatch.gui.models import (
     MidiMessageHumanModel,
@@ -30,9 +30,43 @@ from midiwatch.gui.models import (
 )
 
 
+# Delay during which model updates are coalesced into a single scroll (one frame)
+SCROLL_INTERVAL_MS = 16
+
+# Alignment of the table header labels
+HEADER_ALIGNMENT = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+
+
+def _configure_readonly_table(view: QTableView, column_widths: tuple[int, ...]) -> None:
+    """Configure a message table view as read-only, with fixed column widths.
+
+    The sections are set to a fixed size before being resized, and the last one is
+    stretched once all the widths are set.
+
+    Arguments:
+        view: The table view to configure.
+        column_widths: Widths (in pixels) of the columns, in order.
+    """
+    view.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+    view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+    view.verticalHeader().setVisible(False)
+    view.setShowGrid(False)
+
+    header = view.horizontalHeader()
+    header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+    header.setFixedHeight(32)
+    for section, width in enumerate(column_widths):
+        header.resizeSection(section, width)
+    header.setStretchLastSection(True)
+    header.setDefaultAlignment(HEADER_ALIGNMENT)
+
+
 class HumanTableView(QTableView):
     """Specialized table view for human-readable MIDI messages."""
 
+    # Type, Channel, Note and Detail columns
+    COLUMN_WIDTHS = (150, 100, 90, 160)
+
     def __init__(self, model: MidiMessageHumanModel) -> None:
         """Initialize the human-readable table view."""
         super().__init__()
@@ -42,29 +76,14 @@ class HumanTableView(QTableView):
 
     def _setup_ui(self):
         """Configure view settings and column widths."""
-        self.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
-        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
-        self.verticalHeader().setVisible(False)
-        self.horizontalHeader().setStretchLastSection(True)
-        self.setShowGrid(False)
-        self.setAlternatingRowColors(False)
-
-        header = self.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
-
-        header.setFixedHeight(32)
-        header.resizeSection(0, 150)  # Type
-        header.resizeSection(1, 100)  # Channel
-        header.resizeSection(2, 90)  # Note
-        header.resizeSection(3, 160)  # Detail
-        header.setDefaultAlignment(
-            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
-        )
+        _configure_readonly_table(self, self.COLUMN_WIDTHS)
 
 
 class HexTableView(QTableView):
     """Specialized table view for hexadecimal MIDI messages."""
 
+    COLUMN_WIDTHS = (150, 150, 150)
+
     def __init__(self, model: MidiMessageHexModel) -> None:
         """Initialize the hexadecimal table view."""
         super().__init__()
@@ -74,26 +93,14 @@ class HexTableView(QTableView):
 
     def _setup_ui(self):
         """Configure view settings and column widths."""
-        self.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
-        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
-        self.verticalHeader().setVisible(False)
-        self.horizontalHeader().setStretchLastSection(True)
-        self.setShowGrid(False)
-
-        header = self.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
-        header.setFixedHeight(32)
-        header.resizeSection(0, 150)
-        header.resizeSection(1, 150)
-        header.resizeSection(2, 150)
-        header.setDefaultAlignment(
-            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
-        )
+        _configure_readonly_table(self, self.COLUMN_WIDTHS)
 
 
 class BinaryTableView(QTableView):
     """Specialized table view for binary MIDI messages."""
 
+    COLUMN_WIDTHS = (150, 150, 150)
+
     def __init__(self, model: MidiMessageBinaryModel) -> None:
         """Initialize the binary table view."""
         super().__init__()
@@ -103,21 +110,7 @@ class BinaryTableView(QTableView):
 
     def _setup_ui(self):
         """Configure view settings and column widths."""
-        self.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
-        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
-        self.verticalHeader().setVisible(False)
-        self.horizontalHeader().setStretchLastSection(True)
-        self.setShowGrid(False)
-
-        header = self.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
-        header.setFixedHeight(32)
-        header.resizeSection(0, 150)
-        header.resizeSection(1, 150)
-        header.resizeSection(2, 150)
-        header.setDefaultAlignment(
-            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
-        )
+        _configure_readonly_table(self, self.COLUMN_WIDTHS)
 
 
 class TableStackManager(QWidget):
@@ -136,30 +129,80 @@ class TableStackManager(QWidget):
         self._hex_view = hex_view
         self._binary_view = binary_view
 
+        self._scroll_timer = QTimer(self)
+        self._scroll_timer.setSingleShot(True)
+        self._scroll_timer.setInterval(SCROLL_INTERVAL_MS)
+
         self._setup_ui()
         self._setup_connections()
 
     def _setup_ui(self) -> None:
         """Create the stacked layout with table views."""
-        self._stack_layout = QStackedLayout()
+        self._stack_layout = QStackedLayout(self)
         self._stack_layout.setContentsMargins(0, 0, 0, 0)
         self._stack_layout.addWidget(self._human_view)
         self._stack_layout.addWidget(self._hex_view)
         self._stack_layout.addWidget(self._binary_view)
 
-        self.setLayout(self._stack_layout)
+        self._pause_hidden_models(self._stack_layout.currentWidget())
 
     def _setup_connections(self) -> None:
-        """Connect model signals for auto-scrolling."""
-        self._human_view.model().rowsInserted.connect(
-            lambda parent, first, last: self._human_view.scrollToBottom()
-        )
-        self._hex_view.model().rowsInserted.connect(
-            lambda parent, first, last: self._hex_view.scrollToBottom()
-        )
-        self._binary_view.model().rowsInserted.connect(
-            lambda parent, first, last: self._binary_view.scrollToBottom()
-        )
+        """Connect model signals for auto-scrolling.
+
+        Once full, the models overwrite their oldest rows instead of inserting new
+        ones, so changed rows also scroll the views to the bottom. Updates are
+        coalesced into at most one scroll per SCROLL_INTERVAL_MS, and only the
+        displayed view is scrolled: the others are scrolled when they are displayed.
+        """
+        for view, scroll_slot in (
+            (self._human_view, self._scroll_human),
+            (self._hex_view, self._scroll_hex),
+            (self._binary_view, self._scroll_binary),
+        ):
+            model = view.model()
+            model.rowsInserted.connect(scroll_slot)
+            model.dataChanged.connect(scroll_slot)
+
+        self._scroll_timer.timeout.connect(self._scroll_current_view)
+        self._stack_layout.currentChanged.connect(self._scroll_current_view)
+
+    @Slot()
+    def _scroll_human(self) -> None:
+        """Auto-scroll the human-readable view."""
+        self._scroll_if_current(self._human_view)
+
+    @Slot()
+    def _scroll_hex(self) -> None:
+        """Auto-scroll the hexadecimal view."""
+        self._scroll_if_current(self._hex_view)
+
+    @Slot()
+    def _scroll_binary(self) -> None:
+        """Auto-scroll the binary view."""
+        self._scroll_if_current(self._binary_view)
+
+    def _scroll_if_current(self, view: QTableView) -> None:
+        """Schedule a scroll to the last row if a view is the displayed view.
+
+        Arguments:
+            view: The view whose model received new messages.
+        """
+        if (
+            self._stack_layout.currentWidget() is view
+            and not self._scroll_timer.isActive()
+        ):
+            self._scroll_timer.start()
+
+    @Slot()
+    def _scroll_current_view(self) -> None:
+        """Scroll the displayed view to its last row.
+
+        Also called when the displayed view changes, to catch up with the messages
+        received while it was hidden.
+        """
+        current_view = self._stack_layout.currentWidget()
+        if current_view is not None:
+            current_view.scrollToBottom()
 
     @Slot(int)
     def set_current_view(self, view_index: int) -> None:
@@ -168,4 +211,19 @@ class TableStackManager(QWidget):
         Arguments:
             view_index: Index of the view to display in the stack
         """
+        view = self._stack_layout.widget(view_index)
+        if view is not None:
+            self._pause_hidden_models(view)
         self._stack_layout.setCurrentIndex(view_index)
+
+    def _pause_hidden_models(self, current_view: QTableView) -> None:
+        """Pause the models of the hidden views and resume the displayed one.
+
+        The hidden views are then not notified of each new message: their models
+        catch up at once when they are displayed.
+
+        Arguments:
+            current_view: The view displayed in the stack.
+        """
+        for view in (self._human_view, self._hex_view, self._binary_view):
+            view.model().set_paused(view is not current_view)
@@ -52,14 +52,12 @@ class ViewSelector(QWidget):
         self._group_button.addButton(hex_lbtn.button, 1)
         self._group_button.addButton(binary_lbtn.button, 2)
 
-        layout_hbox = QHBoxLayout()
+        layout_hbox = QHBoxLayout(self)
         layout_hbox.setContentsMargins(0, 0, 0, 0)
         layout_hbox.setSpacing(16)
         layout_hbox.addWidget(human_lbtn)
         layout_hbox.addWidget(hex_lbtn)
         layout_hbox.addWidget(binary_lbtn)
 
-        self.setLayout(layout_hbox)
-
     def _setup_connections(self):
-        self._group_button.idClicked.connect(self.view_changed.emit)
+        self._group_button.idClicked.connect(self.view_changed)